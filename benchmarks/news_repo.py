@@ -0,0 +1,184 @@
+"""
+Benchmark of `NewsRepo` read queries on synthetic `articles` and `article_tags`.
+
+Rows are generated in a scratch schema which copies the structure and the
+indexes of the migrated tables, so the database has to be upgraded with
+alembic first. Connection settings are read from `DB__*` environment
+variables, same as the application.
+
+    python -m benchmarks.news_repo --rows 1000000
+    python -m benchmarks.news_repo --rows 1000000 --without-indexes
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.http.setup.orm_mapping import setup_orm_mapping
+from src.infra.config_loader import load_config
+from src.infra.db.config import DbConfig
+from src.infra.db.factories import create_engine, create_session_maker
+from src.infra.db.repositories import NewsRepo
+
+SCHEMA = "news_bench"
+TAGS_PER_ARTICLE = 3
+
+
+async def seed(session: AsyncSession, rows: int, tags: int, days: int):
+    await session.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await session.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for table in ("articles", "article_tags"):
+        await session.execute(
+            text(f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)")
+        )
+    await session.execute(
+        text(
+            f"""
+            INSERT INTO {SCHEMA}.articles
+                (id, pub_date, title, preview_url, parsed_date)
+            SELECT
+                (1000000 + g)::text,
+                now() - random() * make_interval(days => :days),
+                'Title of the news number ' || g,
+                'https://mosday.ru/news/img/' || g || '.jpg',
+                now()
+            FROM generate_series(1, :rows) AS g
+            """
+        ),
+        {"rows": rows, "days": days},
+    )
+    await session.execute(
+        text(
+            f"""
+            INSERT INTO {SCHEMA}.article_tags (tag, pub_date, article_id)
+            SELECT DISTINCT
+                'tag' || ((articles.id::int + n * 7919) % :tags),
+                articles.pub_date,
+                articles.id
+            FROM {SCHEMA}.articles
+            CROSS JOIN generate_series(0, :tags_per_article - 1) AS n
+            """
+        ),
+        {"tags": tags, "tags_per_article": TAGS_PER_ARTICLE},
+    )
+    await session.commit()
+    await session.execute(text(f"ANALYZE {SCHEMA}.articles, {SCHEMA}.article_tags"))
+
+
+async def drop_indexes(session: AsyncSession):
+    names = await session.scalars(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = :schema AND indexname LIKE 'ix\\_%'"
+        ),
+        {"schema": SCHEMA},
+    )
+    for name in names.all():
+        await session.execute(text(f"DROP INDEX {SCHEMA}.{name}"))
+    await session.commit()
+    await session.execute(text(f"ANALYZE {SCHEMA}.articles, {SCHEMA}.article_tags"))
+
+
+async def explain(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    title: str,
+    func: Callable[[], Awaitable[Any]],
+):
+    executed: list[tuple[str, Any]] = []
+
+    def capture(conn: Any, cursor: Any, statement: str, parameters: Any, *_: Any):
+        executed.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await func()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    statement, parameters = executed[-1]
+    conn = await session.connection()
+    plan = await conn.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) {statement}", parameters
+    )
+    print(f"\n=== {title}\n{statement}\n{parameters}\n")
+    print("\n".join(row[0] for row in plan))
+
+
+async def measure(title: str, repeat: int, func: Callable[[], Awaitable[Any]]):
+    await func()
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{title:<40} median {statistics.median(timings):8.2f} ms"
+        f"   p95 {p95:8.2f} ms   max {timings[-1]:8.2f} ms"
+    )
+
+
+async def main(args: argparse.Namespace):
+    setup_orm_mapping()
+    config = load_config(DbConfig, scope="DB")
+    engine = create_engine(url=config.url, echo=False)
+    session_maker = create_session_maker(engine)
+    try:
+        async with session_maker() as session:
+            if not args.skip_seed:
+                print(f"Seeding {args.rows} articles into {SCHEMA} ...")
+                await seed(session, args.rows, args.tags, args.days)
+            if args.without_indexes:
+                await drop_indexes(session)
+            await session.execute(text(f"SET search_path TO {SCHEMA}"))
+            news_repo = NewsRepo(session)
+            tag = "tag7"
+
+            queries: list[tuple[str, Callable[[], Awaitable[Any]]]] = [
+                (
+                    f"get_by_tag(day={args.day})",
+                    lambda: news_repo.get_by_tag(tag, args.day),
+                ),
+                (
+                    f"get_page_by_tag(day={args.days}, limit=100)",
+                    lambda: news_repo.get_page_by_tag(tag, args.days, 100),
+                ),
+                ("get_latest_news_id", news_repo.get_latest_news_id),
+                (
+                    "get_latest_news_id_by_tag",
+                    lambda: news_repo.get_latest_news_id_by_tag(tag),
+                ),
+            ]
+            for title, func in queries:
+                await explain(engine, session, title, func)
+            print()
+            for title, func in queries:
+                await measure(title, args.repeat, func)
+            await session.execute(text("RESET search_path"))
+            if not args.keep:
+                await session.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+                await session.commit()
+    finally:
+        await engine.dispose()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--tags", type=int, default=350)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--day", type=int, default=5, help="`day` of /{tag}/news")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--without-indexes", action="store_true")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--keep", action="store_true", help="keep scratch schema")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,85 @@
+"""
+Benchmark of CPU time spent serializing a `/{tag}/news` response.
+
+Compares the `response_model` path FastAPI takes when a handler returns the
+mapped `NewsEntry` rows (pydantic validation, `jsonable_encoder`, `json`)
+with `DataclassJSONResponse`, which hands the rows to orjson directly. No
+database is needed, rows are built in memory.
+
+    python -m benchmarks.news_serialization --items 3000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.domain.news import NewsEntry
+from src.http.responses import DataclassJSONResponse
+from src.http.setup.orm_mapping import setup_orm_mapping
+from src.utils.dt import now
+
+
+def build_news(items: int) -> list[NewsEntry]:
+    parsed_date = now()
+    return [
+        NewsEntry(
+            id=str(1000000 + i),
+            tag="metro",
+            title=f"Новость номер {i} о московском метро",
+            preview_url=f"https://mosday.ru/news/img/{i}.jpg",
+            pub_date=parsed_date - timedelta(minutes=i),
+            parsed_date=parsed_date,
+        )
+        for i in range(items)
+    ]
+
+
+async def measure(title: str, repeat: int, func: Callable[[], Awaitable[bytes]]):
+    body = await func()
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.process_time()
+        await func()
+        timings.append((time.process_time() - started) * 1000)
+    print(
+        f"{title:<12} cpu median {statistics.median(timings):8.2f} ms"
+        f"   mean {statistics.mean(timings):8.2f} ms   body {len(body)} bytes"
+    )
+    return statistics.median(timings), body
+
+
+async def main(args: argparse.Namespace):
+    setup_orm_mapping()
+    news = build_news(args.items)
+    field = create_response_field(name="news", type_=list[NewsEntry])
+
+    async def pydantic_path():
+        content: Any = await serialize_response(
+            field=field, response_content=news, is_coroutine=True
+        )
+        return JSONResponse(content).body
+
+    async def orjson_path():
+        return DataclassJSONResponse(news).body
+
+    print(f"{args.items} items, {args.repeat} requests")
+    before, expected = await measure("pydantic", args.repeat, pydantic_path)
+    after, body = await measure("orjson", args.repeat, orjson_path)
+    print(f"speedup x{before / after:.1f}, same body: {body == expected}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
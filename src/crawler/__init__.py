@@ -0,0 +1 @@
+app_name = "Ictransport Test Case Crawler"
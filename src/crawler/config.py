@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from src.config import AppConfig
+from src.infra.db.config import DbConfig, LeaderConfig, PartitionConfig
+from src.infra.mosday.config import CrawlerConfig
+
+
+@dataclass(slots=True)
+class Config:
+    db: DbConfig
+    app: AppConfig
+    crawler: CrawlerConfig = field(default_factory=CrawlerConfig)
+    partitions: PartitionConfig = field(default_factory=PartitionConfig)
+    leader: LeaderConfig = field(default_factory=LeaderConfig)
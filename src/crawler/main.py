@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import signal
+
+from src.http.setup import setup_crawler, setup_db, setup_orm_mapping, start_crawler
+from src.infra.config_loader import load_config
+from src.infra.db.partitions import PartitionManager
+from src.infra.log import setup_logging
+from src.infra.tasks import Tasks
+
+from . import app_name
+from .config import Config
+
+
+async def main_async():
+    config = load_config(Config)
+
+    log_level = "DEBUG" if config.app.is_dev else "INFO"
+    logger = logging.getLogger(app_name)
+    setup_logging(app_name, log_level)
+    setup_orm_mapping()
+
+    should_exit = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, should_exit.set)
+
+    tasks = Tasks()
+
+    engine, session_maker = setup_db(config.db)
+    await tasks.build_add(engine, stop=engine.dispose())
+
+    # API processes learn about stored news from the change feed, which is
+    # published by the repository on every write
+    crawler = setup_crawler(config.crawler, session_maker, logger)
+    try:
+        await start_crawler(
+            crawler,
+            PartitionManager(engine, config.partitions, logger),
+            tasks,
+            config.crawler,
+            config.leader,
+            config.db.dsn,
+            logger,
+        )
+        await should_exit.wait()
+    finally:
+        await tasks.stop()
+
+
+def main_sync():
+    import uvloop
+
+    uvloop.install()
+    asyncio.run(main_async())
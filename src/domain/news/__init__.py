@@ -1,3 +1,3 @@
-from .models import NewsEntry
+from .models import NewsArticle, NewsEntry
 
-__all__ = ("NewsEntry",)
+__all__ = ("NewsArticle", "NewsEntry")
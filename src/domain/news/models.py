@@ -10,3 +10,13 @@ class NewsEntry:
     preview_url: str
     pub_date: datetime.datetime
     parsed_date: datetime.datetime
+
+
+@dataclass
+class NewsArticle:
+    id: str
+    title: str
+    preview_url: str
+    pub_date: datetime.datetime
+    parsed_date: datetime.datetime
+    tags: list[str]
@@ -1,15 +1,27 @@
-from src.config import AppConfig
-from src.http.main import main_sync
+from src.http.config import Config
+from src.http.main import bind_sockets, main_sync
 from src.infra.config_loader import load_config
 
 
 def main():
-    app_settings = load_config(AppConfig, scope="APP")
-    if app_settings.is_dev:
+    # workers load the same config, a broken one fails here once instead of
+    # in every spawned process
+    config = load_config(Config)
+    if config.app.is_dev:
         from src.utils.reloader import FileReloader
 
         reloader = FileReloader(target=main_sync)
         reloader.start()
+    elif config.http.workers > 1:
+        from src.utils.supervisor import WorkerSupervisor
+
+        supervisor = WorkerSupervisor(
+            target=main_sync,
+            sockets=bind_sockets(config.http),
+            workers=config.http.workers,
+            graceful_timeout=config.http.graceful_timeout,
+        )
+        supervisor.start()
     else:
         main_sync()
 
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+from .config import CacheConfig
+
+CacheKey = tuple[frozenset[str], Hashable]
+CachedResponse = tuple[bytes, dict[str, str]]
+
+
+class NewsResponseCache:
+    def __init__(self, config: CacheConfig) -> None:
+        self._config = config
+        self._entries: OrderedDict[
+            CacheKey, tuple[float, CachedResponse]
+        ] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._clock = 0
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, tags: frozenset[str]) -> int:
+        return max((self._generations.get(tag, 0) for tag in tags), default=0)
+
+    def get(self, tags: frozenset[str], params: Hashable) -> CachedResponse | None:
+        key = (tags, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(
+        self,
+        tags: frozenset[str],
+        params: Hashable,
+        response: CachedResponse,
+        generation: int,
+    ):
+        # a tag was written while the response was being built, so the body
+        # may already be stale
+        if generation != self.generation(tags):
+            return
+        size = len(response[0])
+        if not self._config.max_entries or size > self._config.max_bytes:
+            return
+        key = (tags, params)
+        self._pop(key)
+        self._entries[key] = (time.monotonic() + self._config.ttl_seconds, response)
+        self._size += size
+        while (
+            len(self._entries) > self._config.max_entries
+            or self._size > self._config.max_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+    def invalidate(self, tags: set[str]):
+        self._clock += 1
+        for tag in tags:
+            self._generations[tag] = self._clock
+        for key in [key for key in self._entries if not key[0].isdisjoint(tags)]:
+            self._pop(key)
+
+    def _pop(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1][0])
@@ -1,19 +1,127 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
 
 from src.config import AppConfig
-from src.infra.db.config import DbConfig
+from src.infra.db.config import DbConfig, LeaderConfig, PartitionConfig
 from src.infra.mosday.config import CrawlerConfig
 
 
+class CrawlerMode(Enum):
+    EMBEDDED = "embedded"
+    DISABLED = "disabled"
+
+
 @dataclass(slots=True)
 class HttpConfig:
     host: str = "127.0.0.1"
     port: int = 80
+    crawler_mode: CrawlerMode = CrawlerMode.EMBEDDED
+    workers: int = 1
+    graceful_timeout: float = 30
+
+    def __post_init__(self):
+        if self.workers < 1:
+            raise RuntimeError(
+                "Value of `workers` variable expected is positive, "
+                f"but received `{self.workers}`"
+            )
+        if self.graceful_timeout <= 0:
+            raise RuntimeError(
+                "Value of `graceful_timeout` variable expected is positive, "
+                f"but received `{self.graceful_timeout}`"
+            )
+
+    @property
+    def is_crawler_embedded(self):
+        return self.crawler_mode is CrawlerMode.EMBEDDED
+
+
+@dataclass(slots=True)
+class CacheConfig:
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+    ttl_seconds: float = 60
+
+    def __post_init__(self):
+        if self.max_entries < 0:
+            raise RuntimeError(
+                "Value of `max_entries` variable expected is non-negative, "
+                f"but received `{self.max_entries}`"
+            )
+        if self.max_bytes < 0:
+            raise RuntimeError(
+                "Value of `max_bytes` variable expected is non-negative, "
+                f"but received `{self.max_bytes}`"
+            )
+        if self.ttl_seconds <= 0:
+            raise RuntimeError(
+                "Value of `ttl_seconds` variable expected is positive, "
+                f"but received `{self.ttl_seconds}`"
+            )
+
+
+@dataclass(slots=True)
+class NewsIndexConfig:
+    window_days: int = 7
+
+    def __post_init__(self):
+        if self.window_days < 0:
+            raise RuntimeError(
+                "Value of `window_days` variable expected is non-negative, "
+                f"but received `{self.window_days}`"
+            )
+
+
+class ChangeFeedMode(Enum):
+    LISTEN = "listen"
+    DISABLED = "disabled"
+
+
+@dataclass(slots=True)
+class ChangeFeedConfig:
+    mode: ChangeFeedMode = ChangeFeedMode.LISTEN
+    keepalive_seconds: float = 30
+    reconnect_seconds: float = 5
+
+    def __post_init__(self):
+        if self.keepalive_seconds <= 0:
+            raise RuntimeError(
+                "Value of `keepalive_seconds` variable expected is positive, "
+                f"but received `{self.keepalive_seconds}`"
+            )
+        if self.reconnect_seconds <= 0:
+            raise RuntimeError(
+                "Value of `reconnect_seconds` variable expected is positive, "
+                f"but received `{self.reconnect_seconds}`"
+            )
+
+    @property
+    def is_enabled(self):
+        return self.mode is ChangeFeedMode.LISTEN
 
 
 @dataclass(slots=True)
 class Config:
     db: DbConfig
     app: AppConfig
-    crawler: CrawlerConfig
     http: HttpConfig
+    crawler: CrawlerConfig = field(default_factory=CrawlerConfig)
+    partitions: PartitionConfig = field(default_factory=PartitionConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    news_index: NewsIndexConfig = field(default_factory=NewsIndexConfig)
+    change_feed: ChangeFeedConfig = field(default_factory=ChangeFeedConfig)
+    leader: LeaderConfig = field(default_factory=LeaderConfig)
+
+    def __post_init__(self):
+        # every worker runs the whole application, the lock keeps a single
+        # crawler among them
+        if (
+            self.http.workers > 1
+            and self.http.is_crawler_embedded
+            and not self.leader.is_enabled
+        ):
+            raise RuntimeError(
+                "Value of `workers` variable greater than 1 expects leader "
+                "election or a disabled crawler, but received "
+                f"`{self.http.workers}` with `{self.leader.mode.value}` election"
+            )
@@ -1,19 +1,47 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from .stubs import StubAsyncConnection
+from src.infra.db.dto import Role
+
+from .stubs import (
+    LeadershipStatus,
+    PrestartProgress,
+    StubAsyncConnection,
+    StubLeadershipStatus,
+    StubPrestartProgress,
+)
 
 router = APIRouter()
 
 
 @router.get("/health-check", include_in_schema=False)
-async def health_check(
+async def health_check():
+    return Response(status_code=204)
+
+
+@router.get("/readiness", include_in_schema=False)
+async def readiness(
     conn: AsyncConnection = Depends(StubAsyncConnection),
+    progress: PrestartProgress = Depends(StubPrestartProgress),
+    leadership: LeadershipStatus = Depends(StubLeadershipStatus),
 ):
     try:
         (await conn.scalars(text("SELECT version()"))).one()
     except SQLAlchemyError:
-        return Response(status_code=500)
-    return Response(status_code=204)
+        return Response(status_code=503)
+    # news are served from the database while the backfill runs, so only the
+    # database decides readiness and the backfill state is just reported
+    return ORJSONResponse(
+        {
+            **asdict(progress),
+            "role": leadership.role,
+            "role_since": leadership.since,
+            "is_backfill_pending": leadership.role is Role.LEADER
+            and not progress.is_done,
+        }
+    )
@@ -1,17 +1,137 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Hashable, Sequence
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import PositiveInt
-from src.domain.news import NewsEntry
+from src.domain.news import NewsArticle, NewsEntry
 from src.constants import TAGS
 
-from .stubs import NewsRepo, StubNewsRepo
+from ..pagination import Cursor, decode_cursor, encode_cursor
+from ..responses import DataclassJSONResponse, render_ndjson
+from .stubs import (
+    NewsIndex,
+    NewsRepo,
+    NewsResponseCache,
+    StubNewsIndex,
+    StubNewsRepo,
+    StubNewsResponseCache,
+)
+
+NEWS_PAGE_LIMIT = 100
+NEWS_PAGE_MAX_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+EXPORT_BATCH_SIZE = 1000
+
+PAGE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Value of `cursor` for the next page, "
+                "absent on the last page",
+                "schema": {"type": "string"},
+            }
+        }
+    }
+}
+
+router = APIRouter(default_response_class=DataclassJSONResponse)
+
 
-router = APIRouter()
+def parse_cursor(cursor: str | None = None) -> Cursor | None:
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{tag}/news", response_model=list[NewsEntry])
+async def cached_page(
+    cache: NewsResponseCache,
+    tags: frozenset[str],
+    params: Hashable,
+    load: Callable[[], Awaitable[tuple[Sequence[Any], bool]]],
+):
+    cached = cache.get(tags, params)
+    if cached is None:
+        generation = cache.generation(tags)
+        news, has_more = await load()
+        headers: dict[str, str] = {}
+        if has_more:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(news[-1].pub_date, news[-1].id)
+        cached = DataclassJSONResponse(news).body, headers
+        cache.put(tags, params, cached, generation)
+    body, headers = cached
+    return Response(body, headers=headers, media_type=DataclassJSONResponse.media_type)
+
+
+@router.get(
+    "/{tag}/news",
+    response_model=list[NewsEntry],
+    responses=PAGE_RESPONSES,
+)
 async def get_news_by_tag(
     tag: TAGS,
     day: PositiveInt,
+    # clients which predate paging send no `limit` and get the largest page
+    limit: int = Query(NEWS_PAGE_MAX_LIMIT, ge=1, le=NEWS_PAGE_MAX_LIMIT),
+    after: Cursor | None = Depends(parse_cursor),
     news_repo: NewsRepo = Depends(StubNewsRepo),
+    cache: NewsResponseCache = Depends(StubNewsResponseCache),
+    news_index: NewsIndex = Depends(StubNewsIndex),
 ):
-    return await news_repo.get_by_tag(tag, day)
+    async def load():
+        page = news_index.get_page_by_tag(tag, day, limit, after)
+        if page is None:
+            return await news_repo.get_page_by_tag(tag, day, limit, after)
+        return page
+
+    return await cached_page(cache, frozenset((tag,)), (day, limit, after), load)
+
+
+@router.get(
+    "/news",
+    response_model=list[NewsArticle],
+    responses=PAGE_RESPONSES,
+)
+async def get_news_by_tags(
+    day: PositiveInt,
+    tag: list[TAGS] = Query(..., min_items=1),
+    limit: int = Query(NEWS_PAGE_LIMIT, ge=1, le=NEWS_PAGE_MAX_LIMIT),
+    after: Cursor | None = Depends(parse_cursor),
+    news_repo: NewsRepo = Depends(StubNewsRepo),
+    cache: NewsResponseCache = Depends(StubNewsResponseCache),
+):
+    tags = frozenset(tag)
+    return await cached_page(
+        cache,
+        tags,
+        ("merged", day, limit, after),
+        lambda: news_repo.get_page_by_tags(sorted(tags), day, limit, after),
+    )
+
+
+@router.get(
+    "/news/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One JSON encoded news entry per line, oldest first",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def export_news(
+    tag: list[TAGS] = Query([]),
+    since: datetime | None = None,
+    until: datetime | None = None,
+    news_repo: NewsRepo = Depends(StubNewsRepo),
+):
+    async def rows():
+        async for batch in news_repo.stream_by_tags(
+            tag, since, until, EXPORT_BATCH_SIZE
+        ):
+            yield render_ndjson(batch)
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
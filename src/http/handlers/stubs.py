@@ -1,7 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from src.http.cache import NewsResponseCache
+from src.http.news_index import NewsIndex
 from src.http.stub import Stub
+from src.infra.db.dto import LeadershipStatus
 from src.infra.db.repositories import NewsRepo
+from src.infra.mosday.dto import PrestartProgress
 
 StubAsyncConnection = Stub(AsyncConnection)
 StubNewsRepo = Stub(NewsRepo)
+StubNewsResponseCache = Stub(NewsResponseCache)
+StubNewsIndex = Stub(NewsIndex)
+StubPrestartProgress = Stub(PrestartProgress)
+StubLeadershipStatus = Stub(LeadershipStatus)
@@ -1,24 +1,32 @@
 import asyncio
 import logging
+from socket import socket
 
 import uvicorn
 
 from src.infra.config_loader import load_config
+from src.infra.db.dto import LeadershipStatus, NewsChange, Role
+from src.infra.db.notifications import NewsChangeFeed
+from src.infra.db.partitions import PartitionManager
 from src.infra.log import setup_logging
+from src.infra.mosday.dto import PrestartProgress
 from src.infra.tasks import Tasks
 
 from . import app_name
-from .config import Config
+from .cache import NewsResponseCache
+from .config import Config, HttpConfig
+from .news_index import NewsIndex
 from .setup import (
     setup_api,
     setup_crawler,
     setup_db,
     setup_dependencies,
     setup_orm_mapping,
+    start_crawler,
 )
 
 
-async def main_async():
+async def main_async(sockets: list[socket] | None = None):
     config = load_config(Config)
 
     log_level = "DEBUG" if config.app.is_dev else "INFO"
@@ -28,14 +36,67 @@ async def main_async():
 
     tasks = Tasks()
 
-    engine, session_maker = setup_db(config)
+    engine, session_maker = setup_db(config.db)
     await tasks.build_add(engine, stop=engine.dispose())
 
-    crawler = setup_crawler(config.crawler, session_maker, logger)
-    await crawler.prestart()
-    await tasks.add(crawler)
+    news_cache = NewsResponseCache(config.cache)
+    news_index = NewsIndex(session_maker, config.news_index, logger)
+    await tasks.add(news_index)
 
-    dependencies_overrides = setup_dependencies(engine, session_maker)
+    if config.http.is_crawler_embedded:
+        crawler = setup_crawler(config.crawler, session_maker, logger)
+        # the index has to be updated before cached responses are rebuilt from it
+        crawler.add_listener(news_index.add)
+        crawler.add_listener(
+            lambda news_entries: news_cache.invalidate(
+                {news_entry.tag for news_entry in news_entries}
+            )
+        )
+        progress = crawler.progress
+    else:
+        # news are written by `python -m src.crawler`, this process only reads
+        # them and learns about new ones from the change feed
+        if not config.change_feed.is_enabled:
+            logger.warning("Crawler and change feed are disabled, index goes stale")
+        progress = PrestartProgress()
+
+    if config.change_feed.is_enabled:
+        # keeps replicas which do not crawl in sync, the writing process gets
+        # the same changes twice and both steps are idempotent
+        async def on_news_change(change: NewsChange):
+            await news_index.apply_change(change)
+            news_cache.invalidate(set(change.tags))
+
+        change_feed = NewsChangeFeed(
+            config.db.dsn,
+            logger,
+            config.change_feed.keepalive_seconds,
+            config.change_feed.reconnect_seconds,
+        )
+        change_feed.subscribe(on_news_change)
+        await tasks.add(change_feed)
+
+    if config.http.is_crawler_embedded:
+        leadership = await start_crawler(
+            crawler,
+            PartitionManager(engine, config.partitions, logger),
+            tasks,
+            config.crawler,
+            config.leader,
+            config.db.dsn,
+            logger,
+        )
+    else:
+        leadership = LeadershipStatus(role=Role.FOLLOWER)
+
+    dependencies_overrides = setup_dependencies(
+        engine,
+        session_maker,
+        progress,
+        news_cache,
+        news_index,
+        leadership,
+    )
     api = setup_api(config, dependencies_overrides)
 
     server_config = uvicorn.Config(
@@ -48,7 +109,8 @@ async def main_async():
         date_header=False,
     )
     server = uvicorn.Server(config=server_config)
-    sockets = [server_config.bind_socket()]
+    if sockets is None:
+        sockets = [server_config.bind_socket()]
     try:
         await server.serve(sockets)
     finally:
@@ -56,8 +118,14 @@ async def main_async():
         await tasks.stop()
 
 
-def main_sync():
+def main_sync(sockets: list[socket] | None = None):
     import uvloop
 
     uvloop.install()
-    asyncio.run(main_async())
+    asyncio.run(main_async(sockets))
+
+
+def bind_sockets(config: HttpConfig) -> list[socket]:
+    # the app is loaded by workers, binding only needs the address
+    server_config = uvicorn.Config(app=None, host=config.host, port=config.port)
+    return [server_config.bind_socket()]
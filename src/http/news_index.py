@@ -0,0 +1,150 @@
+import asyncio
+import datetime
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import timedelta, timezone
+from logging import Logger
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.news import NewsEntry
+from src.infra.db.dto import NewsChange
+from src.infra.db.repositories import NewsRepo
+from src.utils.dt import utcnow
+
+from .config import NewsIndexConfig
+
+Key = tuple[float, str]
+
+
+@dataclass(slots=True)
+class IndexedNews:
+    id: str
+    tag: str
+    title: str
+    preview_url: str
+    pub_date: datetime.datetime
+    parsed_date: datetime.datetime
+
+
+class _TagIndex:
+    __slots__ = ("keys", "entries")
+
+    def __init__(self) -> None:
+        # both lists are sorted by (pub_date, id) ascending
+        self.keys: list[Key] = []
+        self.entries: list[IndexedNews] = []
+
+    def add(self, entry: IndexedNews):
+        key = (entry.pub_date.timestamp(), entry.id)
+        if not self.keys or self.keys[-1] < key:
+            self.keys.append(key)
+            self.entries.append(entry)
+            return
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            return
+        self.keys.insert(position, key)
+        self.entries.insert(position, entry)
+
+    def prune(self, before: float):
+        position = bisect_left(self.keys, before, key=lambda key: key[0])
+        del self.keys[:position]
+        del self.entries[:position]
+
+
+class NewsIndex:
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: NewsIndexConfig,
+        logger: Logger,
+    ) -> None:
+        self._session_maker = session_maker
+        self._config = config
+        self._logger = logger.getChild(type(self).__name__)
+        self._tags: dict[str, _TagIndex] = {}
+        self._since: datetime.datetime | None = None
+        self._task = None
+
+    @property
+    def is_ready(self):
+        return self._since is not None
+
+    async def start(self):
+        if self._config.window_days:
+            self._task = asyncio.create_task(self._warm())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def add(self, news_entries: Iterable[NewsEntry]):
+        if not self._config.window_days:
+            return
+        for news_entry in news_entries:
+            self._tags.setdefault(news_entry.tag, _TagIndex()).add(
+                IndexedNews(
+                    id=news_entry.id,
+                    tag=news_entry.tag,
+                    title=news_entry.title,
+                    preview_url=news_entry.preview_url,
+                    pub_date=news_entry.pub_date.astimezone(timezone.utc),
+                    parsed_date=news_entry.parsed_date.astimezone(timezone.utc),
+                )
+            )
+        if self._since is not None:
+            self._prune()
+
+    async def apply_change(self, change: NewsChange):
+        if not self._config.window_days:
+            return
+        async with self._session_maker() as session:
+            self.add(await NewsRepo(session).get_by_ids(change.ids))
+
+    def get_page_by_tag(
+        self,
+        tag: str,
+        day: int,
+        limit: int,
+        after: tuple[datetime.datetime, str] | None = None,
+    ) -> tuple[list[IndexedNews], bool] | None:
+        since = utcnow() - timedelta(days=day)
+        if self._since is None or since < self._since:
+            return None
+        index = self._tags.get(tag)
+        if index is None:
+            return [], False
+        lower = bisect_right(index.keys, since.timestamp(), key=lambda key: key[0])
+        upper = len(index.keys)
+        if after is not None:
+            upper = bisect_left(index.keys, (after[0].timestamp(), after[1]))
+        start = max(lower, upper - limit)
+        news = index.entries[start:upper]
+        news.reverse()
+        return news, start > lower
+
+    async def _warm(self):
+        since = utcnow() - timedelta(days=self._config.window_days)
+        try:
+            async with self._session_maker() as session:
+                async for batch in NewsRepo(session).stream_by_tags([], since=since):
+                    self.add(batch)
+        except Exception:
+            self._logger.exception("Warming up failed, news are read from database")
+            return
+        self._since = since
+        self._prune()
+        self._logger.info(
+            f"Warmed up {sum(len(index.keys) for index in self._tags.values())} "
+            f"news of {len(self._tags)} tags since {since}"
+        )
+
+    def _prune(self):
+        since = utcnow() - timedelta(days=self._config.window_days)
+        if self._since is not None and since <= self._since:
+            return
+        self._since = since
+        for index in self._tags.values():
+            index.prune(since.timestamp())
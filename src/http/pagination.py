@@ -0,0 +1,27 @@
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+
+import orjson
+
+Cursor = tuple[datetime, str]
+
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_microsecond = timedelta(microseconds=1)
+
+
+def encode_cursor(pub_date: datetime, news_id: str) -> str:
+    raw = orjson.dumps([(pub_date - _epoch) // _microsecond, news_id])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, news_id = orjson.loads(raw)
+        if not isinstance(timestamp, int) or not isinstance(news_id, str):
+            raise ValueError(cursor)
+        pub_date = _epoch + timestamp * _microsecond
+    except (binascii.Error, OverflowError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor `{cursor}`") from e
+    return pub_date, news_id
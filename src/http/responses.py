@@ -0,0 +1,42 @@
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+_getters: dict[type, tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]] = {}
+
+
+def _dataclass_as_dict(obj: Any) -> dict[str, Any]:
+    # mapped dataclasses carry sqlalchemy state and a __dict__ in load order,
+    # so fields are read explicitly to keep the declared order
+    getter = _getters.get(type(obj))
+    if getter is None:
+        if not is_dataclass(obj):
+            raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+        names = tuple(field.name for field in fields(obj))
+        getter = _getters[type(obj)] = (names, attrgetter(*names))
+    names, get = getter
+    values = get(obj)
+    return dict(zip(names, values if len(names) > 1 else (values,)))
+
+
+class DataclassJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_dataclass_as_dict,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
+
+def render_ndjson(rows: Iterable[Any]) -> bytes:
+    return b"".join(
+        orjson.dumps(
+            row,
+            default=_dataclass_as_dict,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_APPEND_NEWLINE,
+        )
+        for row in rows
+    )
@@ -1,5 +1,5 @@
 from .api import setup_api
-from .crawler import setup_crawler
+from .crawler import setup_crawler, start_crawler
 from .db import setup_db
 from .dependencies import setup_dependencies
 from .orm_mapping import setup_orm_mapping
@@ -10,4 +10,5 @@ __all__ = (
     "setup_api",
     "setup_db",
     "setup_crawler",
+    "start_crawler",
 )
@@ -1,12 +1,14 @@
 from logging import Logger
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.infra.mosday.service import (
-    CrawlerConfig,
-    MosDayApi,
-    MosDayParser,
-    MosDayService,
-)
+from src.infra.db.config import LeaderConfig
+from src.infra.db.dto import LeadershipStatus, Role
+from src.infra.db.leader import LeaderElector
+from src.infra.db.partitions import PartitionManager
+from src.infra.mosday.executor import AsyncMosDayParser
+from src.infra.mosday.service import CrawlerConfig, MosDayApi, MosDayService
+from src.infra.tasks import Tasks
 
 
 def setup_crawler(
@@ -15,9 +17,45 @@ def setup_crawler(
     logger: Logger,
 ):
     return MosDayService(
-        MosDayApi(),
-        MosDayParser(),
+        MosDayApi(config),
+        AsyncMosDayParser(config.parser_backend, config.parser_workers),
         session_maker,
         config,
         logger,
     )
+
+
+async def start_crawler(
+    crawler: MosDayService,
+    partition_manager: PartitionManager,
+    tasks: Tasks,
+    config: CrawlerConfig,
+    leader_config: LeaderConfig,
+    dsn: str,
+    logger: Logger,
+) -> LeadershipStatus:
+    if leader_config.is_enabled:
+        # every replica serves reads, only the one holding the lock crawls and
+        # runs the partition DDL
+        async def lead():
+            await partition_manager.start()
+            try:
+                await crawler.lead()
+            finally:
+                await partition_manager.stop()
+
+        elector = LeaderElector(dsn, leader_config, lead, logger)
+        await tasks.add(elector)
+        await tasks.build_add(crawler, stop=crawler.stop())
+        return elector.status
+    await tasks.add(partition_manager)
+    if config.is_background_prestart:
+        await tasks.build_add(
+            crawler,
+            start=crawler.prestart_and_start(),
+            stop=crawler.stop(),
+        )
+    else:
+        await crawler.prestart()
+        await tasks.add(crawler)
+    return LeadershipStatus(role=Role.LEADER)
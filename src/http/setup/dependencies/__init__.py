@@ -5,7 +5,11 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
+from src.http.cache import NewsResponseCache
+from src.http.news_index import NewsIndex
+from src.infra.db.dto import LeadershipStatus
 from src.infra.db.repositories import NewsRepo
+from src.infra.mosday.dto import PrestartProgress
 
 from .db import get_connection_factory, get_news_repository, get_session_factory
 
@@ -13,10 +17,18 @@ from .db import get_connection_factory, get_news_repository, get_session_factory
 def setup_dependencies(
     engine: AsyncEngine,
     session_maker: async_sessionmaker[AsyncSession],
+    prestart_progress: PrestartProgress,
+    news_cache: NewsResponseCache,
+    news_index: NewsIndex,
+    leadership: LeadershipStatus,
 ):
     return {
         AsyncEngine: lambda: engine,
         AsyncConnection: get_connection_factory(engine),
         AsyncSession: get_session_factory(session_maker),
         NewsRepo: get_news_repository,
+        PrestartProgress: lambda: prestart_progress,
+        NewsResponseCache: lambda: news_cache,
+        NewsIndex: lambda: news_index,
+        LeadershipStatus: lambda: leadership,
     }
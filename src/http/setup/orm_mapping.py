@@ -1,10 +1,23 @@
+from sqlalchemy import join
+
 from src.domain.news import NewsEntry
-from src.infra.db.models import NewsEntryModel
+from src.infra.db.models import ArticleModel, ArticleTagModel
 from src.infra.db.models.base import registry
 
 
 def setup_orm_mapping():
+    articles = ArticleModel.__table__
+    article_tags = ArticleTagModel.__table__
     registry.map_imperatively(
         NewsEntry,
-        NewsEntryModel.__table__,
+        join(
+            articles,
+            article_tags,
+            (articles.c.id == article_tags.c.article_id)
+            & (articles.c.pub_date == article_tags.c.pub_date),
+        ),
+        properties={
+            "id": [articles.c.id, article_tags.c.article_id],
+            "pub_date": [articles.c.pub_date, article_tags.c.pub_date],
+        },
     )
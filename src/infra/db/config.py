@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 
 
 @dataclass(slots=True)
@@ -26,3 +27,65 @@ class DbConfig:
             f"{self.user}:{self.password}@"
             f"{self.host}:{self.port}/{self.name}"
         )
+
+    @property
+    def dsn(self):
+        return (
+            "postgresql://"
+            f"{self.user}:{self.password}@"
+            f"{self.host}:{self.port}/{self.name}"
+        )
+
+
+class RetentionAction(Enum):
+    DETACH = "detach"
+    DROP = "drop"
+
+
+@dataclass(slots=True)
+class PartitionConfig:
+    months_ahead: int = 2
+    retention_days: int = 0
+    retention_action: RetentionAction = RetentionAction.DETACH
+    check_interval_minutes: float = 360
+
+    def __post_init__(self):
+        if self.months_ahead < 0:
+            raise RuntimeError(
+                "Value of `months_ahead` variable expected is not negative, "
+                f"but received `{self.months_ahead}`"
+            )
+        if self.retention_days < 0:
+            raise RuntimeError(
+                "Value of `retention_days` variable expected is not negative, "
+                f"but received `{self.retention_days}`"
+            )
+
+
+class ElectionMode(Enum):
+    ADVISORY_LOCK = "advisory_lock"
+    DISABLED = "disabled"
+
+
+@dataclass(slots=True)
+class LeaderConfig:
+    mode: ElectionMode = ElectionMode.ADVISORY_LOCK
+    lock_key: int = 0x6D6F7364  # "mosd"
+    retry_seconds: float = 5
+    keepalive_seconds: float = 10
+
+    def __post_init__(self):
+        if self.retry_seconds <= 0:
+            raise RuntimeError(
+                "Value of `retry_seconds` variable expected is positive, "
+                f"but received `{self.retry_seconds}`"
+            )
+        if self.keepalive_seconds <= 0:
+            raise RuntimeError(
+                "Value of `keepalive_seconds` variable expected is positive, "
+                f"but received `{self.keepalive_seconds}`"
+            )
+
+    @property
+    def is_enabled(self):
+        return self.mode is ElectionMode.ADVISORY_LOCK
@@ -0,0 +1,61 @@
+import datetime
+from dataclasses import dataclass
+from enum import Enum
+
+
+@dataclass(slots=True)
+class BulkCreateStats:
+    rows: int
+    seconds: float
+    method: str
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass(slots=True)
+class NewsChange:
+    tags: list[str]
+    ids: list[str]
+
+
+class Role(Enum):
+    LEADER = "leader"
+    FOLLOWER = "follower"
+
+
+@dataclass(slots=True)
+class LeadershipStatus:
+    role: Role = Role.FOLLOWER
+    since: datetime.datetime | None = None
+
+
+@dataclass(slots=True)
+class HttpValidator:
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def request_headers(self):
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(slots=True)
+class CrawlState:
+    tag: str
+    last_page: int = 0
+    last_news_id: str | None = None
+    stop_news_id: str | None = None
+    last_success_at: datetime.datetime | None = None
+    error_count: int = 0
+
+    @property
+    def is_in_progress(self):
+        return self.last_page > 0
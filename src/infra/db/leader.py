@@ -0,0 +1,99 @@
+import asyncio
+from logging import Logger
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+
+from src.utils.dt import now
+
+from .config import LeaderConfig
+from .dto import LeadershipStatus, Role
+
+
+class LeaderElector:
+    def __init__(
+        self,
+        dsn: str,
+        config: LeaderConfig,
+        lead: Callable[[], Awaitable[Any]],
+        logger: Logger,
+    ) -> None:
+        self._dsn = dsn
+        self._config = config
+        self._lead = lead
+        self._logger = logger.getChild(type(self).__name__)
+        self._task = None
+        self.status = LeadershipStatus()
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self):
+        while True:
+            try:
+                await self._campaign()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._logger.exception("Leader election failed")
+            await asyncio.sleep(self._config.retry_seconds)
+
+    async def _campaign(self):
+        # the advisory lock belongs to this connection's session, postgres
+        # releases it as soon as the connection is gone, e.g. when the
+        # process dies, which lets another replica take over
+        conn: asyncpg.Connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        conn.add_termination_listener(lambda _: closed.set())
+        try:
+            while not await conn.fetchval(
+                "SELECT pg_try_advisory_lock($1)", self._config.lock_key
+            ):
+                try:
+                    await asyncio.wait_for(closed.wait(), self._config.retry_seconds)
+                except asyncio.TimeoutError:
+                    continue
+                return
+            await self._hold(conn, closed)
+        finally:
+            if not conn.is_closed():
+                await conn.close(timeout=self._config.keepalive_seconds)
+
+    async def _hold(self, conn: asyncpg.Connection, closed: asyncio.Event):
+        self._set_role(Role.LEADER)
+        leading = asyncio.create_task(self._lead())
+        disconnected = asyncio.create_task(closed.wait())
+        try:
+            while True:
+                await asyncio.wait(
+                    [leading, disconnected],
+                    timeout=self._config.keepalive_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnected.done():
+                    self._logger.warning("Lost the connection holding the lock")
+                    return
+                if leading.done():
+                    self._logger.error(
+                        "Leader task stopped, giving up leadership",
+                        exc_info=leading.exception(),
+                    )
+                    return
+                await conn.execute("SELECT 1", timeout=self._config.keepalive_seconds)
+        finally:
+            self._set_role(Role.FOLLOWER)
+            disconnected.cancel()
+            leading.cancel()
+            await asyncio.gather(leading, disconnected, return_exceptions=True)
+
+    def _set_role(self, role: Role):
+        if self.status.role is role:
+            return
+        self.status.role = role
+        self.status.since = now()
+        self._logger.info(f"Became {role.value}")
@@ -0,0 +1,29 @@
+"""http validators
+
+Revision ID: a6168656dd19
+Revises: a5852fc6d4d4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6168656dd19'
+down_revision = 'a5852fc6d4d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('http_validators',
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('etag', sa.String(), nullable=True),
+    sa.Column('last_modified', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('url', name=op.f('pk_http_validators'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('http_validators')
@@ -0,0 +1,32 @@
+"""crawl state
+
+Revision ID: 5dfbdadda6ad
+Revises: a6168656dd19
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5dfbdadda6ad'
+down_revision = 'a6168656dd19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('crawl_state',
+    sa.Column('tag', sa.String(), nullable=False),
+    sa.Column('last_page', sa.Integer(), nullable=False),
+    sa.Column('last_news_id', sa.String(), nullable=True),
+    sa.Column('stop_news_id', sa.String(), nullable=True),
+    sa.Column('last_success_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('tag', name=op.f('pk_crawl_state'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('crawl_state')
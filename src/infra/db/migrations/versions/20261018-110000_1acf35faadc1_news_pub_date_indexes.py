@@ -0,0 +1,50 @@
+"""news pub_date indexes
+
+Revision ID: 1acf35faadc1
+Revises: 5dfbdadda6ad
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1acf35faadc1'
+down_revision = '5dfbdadda6ad'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_news_tag_pub_date',
+            'news',
+            ['tag', sa.text('pub_date DESC')],
+            unique=False,
+            postgresql_include=['id', 'title', 'preview_url', 'parsed_date'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_news_pub_date',
+            'news',
+            [sa.text('pub_date DESC')],
+            unique=False,
+            postgresql_include=['id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_news_pub_date',
+            table_name='news',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_news_tag_pub_date',
+            table_name='news',
+            postgresql_concurrently=True,
+        )
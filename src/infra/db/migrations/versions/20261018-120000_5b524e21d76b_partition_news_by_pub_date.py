@@ -0,0 +1,112 @@
+"""partition news by pub_date
+
+Revision ID: 5b524e21d76b
+Revises: 1acf35faadc1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5b524e21d76b'
+down_revision = '1acf35faadc1'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = "id, tag, title, pub_date, parsed_date, preview_url"
+
+
+def create_indexes() -> None:
+    op.execute(
+        "CREATE INDEX ix_news_tag_pub_date ON news (tag, pub_date DESC) "
+        "INCLUDE (id, title, preview_url, parsed_date)"
+    )
+    op.execute("CREATE INDEX ix_news_pub_date ON news (pub_date DESC) INCLUDE (id)")
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX ix_news_tag_pub_date")
+    op.execute("DROP INDEX ix_news_pub_date")
+    op.execute("ALTER TABLE news RENAME TO news_unpartitioned")
+    op.execute(
+        "ALTER TABLE news_unpartitioned "
+        "RENAME CONSTRAINT pk_news TO pk_news_unpartitioned"
+    )
+    op.execute(
+        """
+        CREATE TABLE news (
+            id VARCHAR NOT NULL,
+            tag VARCHAR NOT NULL,
+            title VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            parsed_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            preview_url VARCHAR NOT NULL,
+            CONSTRAINT pk_news PRIMARY KEY (id, tag, pub_date)
+        ) PARTITION BY RANGE (pub_date)
+        """
+    )
+    op.execute("CREATE TABLE news_default PARTITION OF news DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc(
+                        'month',
+                        coalesce(min(pub_date), now()) AT TIME ZONE 'UTC'
+                    ),
+                    date_trunc('month', now() AT TIME ZONE 'UTC')
+                        + interval '2 months',
+                    interval '1 month'
+                )::date
+                FROM news_unpartitioned
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF news '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'news_p' || to_char(month, 'YYYYMM'),
+                    month || ' 00:00+00',
+                    (month + interval '1 month')::date || ' 00:00+00'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute(f"INSERT INTO news ({COLUMNS}) SELECT {COLUMNS} FROM news_unpartitioned")
+    create_indexes()
+    op.execute("DROP TABLE news_unpartitioned")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE news RENAME TO news_partitioned")
+    op.execute(
+        "ALTER TABLE news_partitioned "
+        "RENAME CONSTRAINT pk_news TO pk_news_partitioned"
+    )
+    op.execute("ALTER INDEX ix_news_tag_pub_date RENAME TO ix_news_partitioned_tag")
+    op.execute("ALTER INDEX ix_news_pub_date RENAME TO ix_news_partitioned_pub_date")
+    op.execute(
+        """
+        CREATE TABLE news (
+            id VARCHAR NOT NULL,
+            tag VARCHAR NOT NULL,
+            title VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            parsed_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            preview_url VARCHAR NOT NULL,
+            CONSTRAINT pk_news PRIMARY KEY (id, tag)
+        )
+        """
+    )
+    op.execute(
+        f"INSERT INTO news ({COLUMNS}) SELECT {COLUMNS} FROM news_partitioned "
+        "ON CONFLICT DO NOTHING"
+    )
+    create_indexes()
+    op.execute("DROP TABLE news_partitioned")
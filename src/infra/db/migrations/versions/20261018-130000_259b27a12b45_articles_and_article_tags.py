@@ -0,0 +1,142 @@
+"""articles and article_tags
+
+Revision ID: 259b27a12b45
+Revises: 5b524e21d76b
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '259b27a12b45'
+down_revision = '5b524e21d76b'
+branch_labels = None
+depends_on = None
+
+
+def create_partitions(tables: list[str], source: str) -> None:
+    for table in tables:
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date;
+            tbl text;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc(
+                        'month',
+                        coalesce(min(pub_date), now()) AT TIME ZONE 'UTC'
+                    ),
+                    date_trunc('month', now() AT TIME ZONE 'UTC')
+                        + interval '2 months',
+                    interval '1 month'
+                )::date
+                FROM {source}
+            LOOP
+                FOREACH tbl IN ARRAY ARRAY['{"', '".join(tables)}'] LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF %I '
+                        'FOR VALUES FROM (%L) TO (%L)',
+                        tbl || '_p' || to_char(month, 'YYYYMM'),
+                        tbl,
+                        month || ' 00:00+00',
+                        (month + interval '1 month')::date || ' 00:00+00'
+                    );
+                END LOOP;
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE articles (
+            id VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            title VARCHAR NOT NULL,
+            preview_url VARCHAR NOT NULL,
+            parsed_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT pk_articles PRIMARY KEY (id, pub_date)
+        ) PARTITION BY RANGE (pub_date)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE article_tags (
+            tag VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            article_id VARCHAR NOT NULL,
+            CONSTRAINT pk_article_tags PRIMARY KEY (tag, pub_date, article_id),
+            CONSTRAINT fk_article_tags_article_id_articles
+                FOREIGN KEY (article_id, pub_date)
+                REFERENCES articles (id, pub_date) ON DELETE CASCADE
+        ) PARTITION BY RANGE (pub_date)
+        """
+    )
+    create_partitions(['articles', 'article_tags'], 'news')
+    op.execute(
+        """
+        INSERT INTO articles (id, pub_date, title, preview_url, parsed_date)
+        SELECT DISTINCT ON (id) id, pub_date, title, preview_url, parsed_date
+        FROM news
+        ORDER BY id, parsed_date DESC
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO article_tags (tag, pub_date, article_id)
+        SELECT DISTINCT news.tag, articles.pub_date, articles.id
+        FROM news JOIN articles ON articles.id = news.id
+        """
+    )
+    op.execute(
+        'CREATE INDEX ix_articles_pub_date ON articles (pub_date DESC) INCLUDE (id)'
+    )
+    op.execute('DROP TABLE news')
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE news (
+            id VARCHAR NOT NULL,
+            tag VARCHAR NOT NULL,
+            title VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            parsed_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            preview_url VARCHAR NOT NULL,
+            CONSTRAINT pk_news PRIMARY KEY (id, tag, pub_date)
+        ) PARTITION BY RANGE (pub_date)
+        """
+    )
+    create_partitions(['news'], 'articles')
+    op.execute(
+        """
+        INSERT INTO news (id, tag, title, pub_date, parsed_date, preview_url)
+        SELECT
+            articles.id,
+            article_tags.tag,
+            articles.title,
+            articles.pub_date,
+            articles.parsed_date,
+            articles.preview_url
+        FROM articles
+        JOIN article_tags
+            ON article_tags.article_id = articles.id
+            AND article_tags.pub_date = articles.pub_date
+        """
+    )
+    op.execute(
+        'CREATE INDEX ix_news_tag_pub_date ON news (tag, pub_date DESC) '
+        'INCLUDE (id, title, preview_url, parsed_date)'
+    )
+    op.execute('CREATE INDEX ix_news_pub_date ON news (pub_date DESC) INCLUDE (id)')
+    op.execute('DROP TABLE article_tags')
+    op.execute('DROP TABLE articles')
@@ -0,0 +1,59 @@
+"""article_ids
+
+Revision ID: 684aeca7ad67
+Revises: 259b27a12b45
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '684aeca7ad67'
+down_revision = '259b27a12b45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE article_ids (
+            id VARCHAR NOT NULL,
+            pub_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT pk_article_ids PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO article_ids (id, pub_date)
+        SELECT DISTINCT ON (id) id, pub_date
+        FROM articles
+        ORDER BY id, parsed_date, pub_date
+        """
+    )
+    # tags stored under another pub_date of the same id are moved to the kept
+    # row, the other rows and their tags are removed by the cascade
+    op.execute(
+        """
+        INSERT INTO article_tags (tag, pub_date, article_id)
+        SELECT article_tags.tag, article_ids.pub_date, article_tags.article_id
+        FROM article_tags
+        JOIN article_ids ON article_ids.id = article_tags.article_id
+        WHERE article_tags.pub_date <> article_ids.pub_date
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM articles
+        USING article_ids
+        WHERE articles.id = article_ids.id
+            AND articles.pub_date <> article_ids.pub_date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TABLE article_ids')
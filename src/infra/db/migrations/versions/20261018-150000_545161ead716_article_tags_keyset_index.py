@@ -0,0 +1,28 @@
+"""article_tags keyset index
+
+Revision ID: 545161ead716
+Revises: 684aeca7ad67
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '545161ead716'
+down_revision = '684aeca7ad67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # the export pages by this key, without the index every page sorts the
+    # whole remaining range
+    op.execute(
+        'CREATE INDEX ix_article_tags_pub_date_article_id_tag '
+        'ON article_tags (pub_date, article_id, tag)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX ix_article_tags_pub_date_article_id_tag')
@@ -1,3 +1,11 @@
-from .news import NewsEntryModel
+from .article import ArticleIdModel, ArticleModel, ArticleTagModel
+from .crawl_state import CrawlStateModel
+from .http_validator import HttpValidatorModel
 
-__all__ = ("NewsEntryModel",)
+__all__ = (
+    "ArticleIdModel",
+    "ArticleModel",
+    "ArticleTagModel",
+    "CrawlStateModel",
+    "HttpValidatorModel",
+)
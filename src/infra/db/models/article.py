@@ -0,0 +1,61 @@
+import datetime
+
+from sqlalchemy import DateTime, ForeignKeyConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Model
+
+
+class ArticleIdModel(Model):
+    __tablename__ = "article_ids"
+
+    # the partitioned tables can not enforce a unique `id`, this table does and
+    # keeps the first seen `pub_date` which every later write reuses
+    id: Mapped[str] = mapped_column(primary_key=True)
+    pub_date: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+
+
+class ArticleModel(Model):
+    __tablename__ = "articles"
+
+    id: Mapped[str] = mapped_column(primary_key=True)
+    pub_date: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    title: Mapped[str]
+    preview_url: Mapped[str]
+    parsed_date: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "ix_articles_pub_date",
+            pub_date.desc(),
+            postgresql_include=["id"],
+        ),
+        {"postgresql_partition_by": "RANGE (pub_date)"},
+    )
+
+
+class ArticleTagModel(Model):
+    __tablename__ = "article_tags"
+
+    tag: Mapped[str] = mapped_column(primary_key=True)
+    pub_date: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    article_id: Mapped[str] = mapped_column(primary_key=True)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["article_id", "pub_date"],
+            [ArticleModel.id, ArticleModel.pub_date],
+            ondelete="CASCADE",
+        ),
+        Index(
+            "ix_article_tags_pub_date_article_id_tag",
+            pub_date,
+            article_id,
+            tag,
+        ),
+        {"postgresql_partition_by": "RANGE (pub_date)"},
+    )
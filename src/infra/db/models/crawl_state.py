@@ -0,0 +1,19 @@
+import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Model
+
+
+class CrawlStateModel(Model):
+    __tablename__ = "crawl_state"
+
+    tag: Mapped[str] = mapped_column(primary_key=True)
+    last_page: Mapped[int] = mapped_column(default=0)
+    last_news_id: Mapped[str | None]
+    stop_news_id: Mapped[str | None]
+    last_success_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    error_count: Mapped[int] = mapped_column(default=0)
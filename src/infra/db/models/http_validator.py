@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Model
+
+
+class HttpValidatorModel(Model):
+    __tablename__ = "http_validators"
+
+    url: Mapped[str] = mapped_column(primary_key=True)
+    etag: Mapped[str | None]
+    last_modified: Mapped[str | None]
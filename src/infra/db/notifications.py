@@ -0,0 +1,133 @@
+import asyncio
+import inspect
+from logging import Logger
+from typing import Any, Callable, Iterable
+
+import asyncpg
+import orjson
+
+from src.domain.news import NewsEntry
+
+from .dto import NewsChange
+
+NEWS_CHANNEL = "news_changes"
+# postgres rejects payloads of 8000 bytes and longer
+MAX_PAYLOAD_SIZE = 7900
+_EMPTY_PAYLOAD_SIZE = len(b'{"tags":[],"ids":[]}')
+
+
+def build_news_payloads(news_entries: Iterable[NewsEntry]) -> list[str]:
+    ids_by_tag: dict[str, dict[str, None]] = {}
+    for news_entry in news_entries:
+        ids_by_tag.setdefault(news_entry.tag, {})[news_entry.id] = None
+    payloads: list[str] = []
+    tags: dict[str, None] = {}
+    ids: dict[str, None] = {}
+    size = _EMPTY_PAYLOAD_SIZE
+    for tag, tag_ids in ids_by_tag.items():
+        for news_id in tag_ids:
+            extra = (0 if tag in tags else _item_size(tag)) + (
+                0 if news_id in ids else _item_size(news_id)
+            )
+            if size + extra > MAX_PAYLOAD_SIZE:
+                payloads.append(_dump(tags, ids))
+                tags, ids = {}, {}
+                size = _EMPTY_PAYLOAD_SIZE
+                extra = _item_size(tag) + _item_size(news_id)
+            tags[tag] = None
+            ids[news_id] = None
+            size += extra
+    if ids:
+        payloads.append(_dump(tags, ids))
+    return payloads
+
+
+def _item_size(value: str):
+    # quoted value and a separating comma
+    return len(orjson.dumps(value)) + 1
+
+
+def _dump(tags: dict[str, None], ids: dict[str, None]):
+    return orjson.dumps({"tags": list(tags), "ids": list(ids)}).decode()
+
+
+class NewsChangeFeed:
+    def __init__(
+        self,
+        dsn: str,
+        logger: Logger,
+        keepalive_seconds: float = 30,
+        reconnect_seconds: float = 5,
+    ) -> None:
+        self._dsn = dsn
+        self._logger = logger.getChild(type(self).__name__)
+        self._keepalive_seconds = keepalive_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._subscribers: list[Callable[[NewsChange], Any]] = []
+        self._pending: set[asyncio.Task[Any]] = set()
+        self._task = None
+
+    def subscribe(self, subscriber: Callable[[NewsChange], Any]):
+        self._subscribers.append(subscriber)
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+        for task in self._pending:
+            task.cancel()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._logger.exception(f"Listening to `{NEWS_CHANNEL}` failed")
+            self._logger.warning(
+                f"Reconnecting in {self._reconnect_seconds} seconds, "
+                "changes made meanwhile are not delivered"
+            )
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _listen(self):
+        conn: asyncpg.Connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        conn.add_termination_listener(lambda _: closed.set())
+        try:
+            await conn.add_listener(NEWS_CHANNEL, self._on_notification)
+            self._logger.info(f"Listening to `{NEWS_CHANNEL}`")
+            while not closed.is_set():
+                try:
+                    await asyncio.wait_for(closed.wait(), self._keepalive_seconds)
+                except asyncio.TimeoutError:
+                    await conn.execute("SELECT 1", timeout=self._keepalive_seconds)
+        finally:
+            if not conn.is_closed():
+                await conn.close(timeout=self._keepalive_seconds)
+
+    def _on_notification(self, conn: Any, pid: int, channel: str, payload: str):
+        try:
+            data = orjson.loads(payload)
+            change = NewsChange(tags=data["tags"], ids=data["ids"])
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            self._logger.error(f"Malformed `{channel}` payload: {payload!r}")
+            return
+        for subscriber in self._subscribers:
+            try:
+                result = subscriber(change)
+            except Exception:
+                self._logger.exception(f"Subscriber {subscriber!r} failed")
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._pending.add(task)
+                task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task[Any]):
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error("Subscriber failed", exc_info=task.exception())
@@ -0,0 +1,128 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from logging import Logger
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.dt import utcnow
+
+from .config import PartitionConfig, RetentionAction
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    prefix = f"{table}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(name[len(prefix) :], "%Y%m").date()
+    except ValueError:
+        return None
+
+
+class PartitionManager:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        config: PartitionConfig,
+        logger: Logger,
+        tables: tuple[str, ...] = ("articles", "article_tags"),
+    ) -> None:
+        self._engine = engine
+        self._config = config
+        self._tables = tables
+        self._logger = logger.getChild(type(self).__name__)
+        self._task = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    async def maintain(self):
+        partitions = {
+            table: await self._get_partitions(table) for table in self._tables
+        }
+        current_month = utcnow().date().replace(day=1)
+        for table in self._tables:
+            for offset in range(self._config.months_ahead + 1):
+                month = add_months(current_month, offset)
+                if partition_name(table, month) not in partitions[table]:
+                    await self._create_partition(table, month)
+        if not self._config.retention_days:
+            return
+        cutoff = utcnow() - timedelta(days=self._config.retention_days)
+        # referencing tables come last in `tables`, so they are detached first
+        for table in reversed(self._tables):
+            for name in sorted(partitions[table]):
+                month = partition_month(table, name)
+                if month is None:
+                    continue
+                upper = add_months(month, 1)
+                if datetime(upper.year, upper.month, 1, tzinfo=timezone.utc) <= cutoff:
+                    await self._expire_partition(table, name)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.maintain()
+            except Exception:
+                self._logger.exception("Partition maintenance failed")
+            await asyncio.sleep(self._config.check_interval_minutes * 60)
+
+    async def _get_partitions(self, table: str) -> set[str]:
+        stmt = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        )
+        async with self._engine.connect() as conn:
+            return set(await conn.scalars(stmt, {"table": table}))
+
+    async def _create_partition(self, table: str, month: date):
+        name = partition_name(table, month)
+        upper = add_months(month, 1)
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" '
+                    f'PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{month} 00:00+00') TO ('{upper} 00:00+00')"
+                )
+            )
+        self._logger.info(f"Created partition `{name}`")
+
+    async def _expire_partition(self, table: str, name: str):
+        detach = f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'
+        async with self._engine.begin() as conn:
+            await conn.execute(text(detach))
+            if self._config.retention_action is RetentionAction.DROP:
+                await conn.execute(text(f'DROP TABLE "{name}"'))
+            else:
+                # a detached partition keeps its foreign keys, which would block
+                # detaching the referenced partition later
+                constraints = await conn.scalars(
+                    text(
+                        "SELECT conname FROM pg_constraint "
+                        "WHERE conrelid = CAST(:name AS regclass) AND contype = 'f'"
+                    ),
+                    {"name": name},
+                )
+                for constraint in constraints.all():
+                    await conn.execute(
+                        text(f'ALTER TABLE "{name}" DROP CONSTRAINT "{constraint}"')
+                    )
+        action = self._config.retention_action.value
+        self._logger.info(f"Partition `{name}` is past retention: {action}")
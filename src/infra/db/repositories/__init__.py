@@ -1,3 +1,5 @@
+from .crawl_state import CrawlStateRepo
+from .http_validator import HttpValidatorRepo
 from .news import NewsRepo
 
-__all__ = ("NewsRepo",)
+__all__ = ("CrawlStateRepo", "HttpValidatorRepo", "NewsRepo")
@@ -0,0 +1,46 @@
+from dataclasses import asdict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.infra.db.models import CrawlStateModel
+from src.infra.db.dto import CrawlState
+
+from .base import SessionRepo
+
+
+class CrawlStateRepo(SessionRepo):
+    async def get(self, tag: str):
+        stmt = select(
+            CrawlStateModel.tag,
+            CrawlStateModel.last_page,
+            CrawlStateModel.last_news_id,
+            CrawlStateModel.stop_news_id,
+            CrawlStateModel.last_success_at,
+            CrawlStateModel.error_count,
+        ).where(CrawlStateModel.tag == tag)
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return CrawlState(**row._asdict())
+
+    async def get_unfinished_tags(self):
+        stmt = select(CrawlStateModel.tag).where(CrawlStateModel.last_page > 0)
+        return set(await self._session.scalars(stmt))
+
+    async def save(self, state: CrawlState):
+        values = asdict(state)
+        stmt = insert(CrawlStateModel).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CrawlStateModel.tag],
+            set_={key: stmt.excluded[key] for key in values if key != "tag"},
+        )
+        await self._session.execute(stmt)
+
+    async def increment_error_count(self, tag: str):
+        stmt = insert(CrawlStateModel).values(tag=tag, last_page=0, error_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CrawlStateModel.tag],
+            set_={"error_count": CrawlStateModel.error_count + 1},
+        )
+        await self._session.execute(stmt)
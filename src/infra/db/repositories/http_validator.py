@@ -0,0 +1,35 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.infra.db.models import HttpValidatorModel
+from src.infra.db.dto import HttpValidator
+
+from .base import SessionRepo
+
+
+class HttpValidatorRepo(SessionRepo):
+    async def get_all(self):
+        stmt = select(
+            HttpValidatorModel.url,
+            HttpValidatorModel.etag,
+            HttpValidatorModel.last_modified,
+        )
+        return [
+            HttpValidator(url=url, etag=etag, last_modified=last_modified)
+            for url, etag, last_modified in await self._session.execute(stmt)
+        ]
+
+    async def save(self, validator: HttpValidator):
+        stmt = insert(HttpValidatorModel).values(
+            url=validator.url,
+            etag=validator.etag,
+            last_modified=validator.last_modified,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HttpValidatorModel.url],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+            },
+        )
+        await self._session.execute(stmt)
@@ -1,54 +1,361 @@
-from dataclasses import asdict
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator
 
-from sqlalchemy import exists, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import String, any_, bindparam, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.news import NewsEntry
-from src.infra.db.models import NewsEntryModel
+from src.domain.news import NewsArticle, NewsEntry
+from src.infra.db.dto import BulkCreateStats
+from src.infra.db.models import ArticleIdModel, ArticleModel, ArticleTagModel
+from src.infra.db.notifications import NEWS_CHANNEL, build_news_payloads
 from src.utils.dt import utcnow
+from src.utils.lru import LruSet
 
 from .base import SessionRepo
 
 
 class NewsRepo(SessionRepo):
+    copy_threshold = 1000
+    _staging_table = "news_staging"
+    _staging_columns = (
+        "position",
+        "id",
+        "tag",
+        "title",
+        "preview_url",
+        "pub_date",
+        "parsed_date",
+    )
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        seen_ids: LruSet[str] | None = None,
+    ) -> None:
+        super().__init__(session)
+        self._seen_ids = seen_ids if seen_ids is not None else LruSet(0)
+
     async def get_by_tag(self, tag: str, day: int):
         stmt = (
             select(NewsEntry)
             .where(
-                NewsEntryModel.tag == tag,
-                NewsEntryModel.pub_date > utcnow() - timedelta(days=day),
+                ArticleTagModel.tag == tag,
+                ArticleTagModel.pub_date > utcnow() - timedelta(days=day),
             )
-            .order_by(NewsEntryModel.pub_date.desc())
+            .order_by(ArticleTagModel.pub_date.desc())
         )
         return (await self._session.scalars(stmt)).all()
 
+    async def get_page_by_tag(
+        self,
+        tag: str,
+        day: int,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[list[NewsEntry], bool]:
+        stmt = select(NewsEntry).where(
+            ArticleTagModel.tag == tag,
+            ArticleTagModel.pub_date > utcnow() - timedelta(days=day),
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(ArticleTagModel.pub_date, ArticleTagModel.article_id)
+                < tuple_(*after)
+            )
+        stmt = stmt.order_by(
+            ArticleTagModel.pub_date.desc(), ArticleTagModel.article_id.desc()
+        ).limit(limit + 1)
+        news = list((await self._session.scalars(stmt)).all())
+        return news[:limit], len(news) > limit
+
+    async def get_by_ids(self, news_ids: list[str]) -> list[NewsEntry]:
+        stmt = select(NewsEntry).where(
+            ArticleModel.id
+            == any_(bindparam("news_ids", news_ids, type_=ARRAY(String)))
+        )
+        return list((await self._session.scalars(stmt)).all())
+
+    async def get_page_by_tags(
+        self,
+        tags: list[str],
+        day: int,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[list[NewsArticle], bool]:
+        stmt = (
+            select(
+                ArticleModel.id,
+                ArticleModel.title,
+                ArticleModel.preview_url,
+                ArticleModel.pub_date,
+                ArticleModel.parsed_date,
+                func.array_agg(ArticleTagModel.tag),
+            )
+            .join(
+                ArticleTagModel,
+                (ArticleTagModel.article_id == ArticleModel.id)
+                & (ArticleTagModel.pub_date == ArticleModel.pub_date),
+            )
+            .where(
+                ArticleTagModel.tag
+                == any_(bindparam("tags", tags, type_=ARRAY(String))),
+                ArticleTagModel.pub_date > utcnow() - timedelta(days=day),
+            )
+            .group_by(ArticleModel.id, ArticleModel.pub_date)
+            .order_by(ArticleModel.pub_date.desc(), ArticleModel.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(ArticleTagModel.pub_date, ArticleTagModel.article_id)
+                < tuple_(*after)
+            )
+        news = [
+            NewsArticle(
+                id=id_,
+                title=title,
+                preview_url=preview_url,
+                pub_date=pub_date,
+                parsed_date=parsed_date,
+                tags=sorted(tags),
+            )
+            for id_, title, preview_url, pub_date, parsed_date, tags in (
+                await self._session.execute(stmt)
+            )
+        ]
+        return news[:limit], len(news) > limit
+
+    async def stream_by_tags(
+        self,
+        tags: list[str],
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[NewsEntry]]:
+        stmt = (
+            select(NewsEntry)
+            .order_by(
+                ArticleTagModel.pub_date,
+                ArticleTagModel.article_id,
+                ArticleTagModel.tag,
+            )
+            .limit(batch_size)
+        )
+        if tags:
+            stmt = stmt.where(ArticleTagModel.tag.in_(tags))
+        if since is not None:
+            stmt = stmt.where(ArticleTagModel.pub_date >= since)
+        if until is not None:
+            stmt = stmt.where(ArticleTagModel.pub_date < until)
+        after: tuple[datetime, str, str] | None = None
+        while True:
+            page = stmt
+            if after is not None:
+                # the plain `pub_date` bound lets the planner prune partitions,
+                # it does not look into the row comparison
+                page = stmt.where(
+                    ArticleTagModel.pub_date >= after[0],
+                    tuple_(
+                        ArticleTagModel.pub_date,
+                        ArticleTagModel.article_id,
+                        ArticleTagModel.tag,
+                    )
+                    > tuple_(*after),
+                )
+            batch = list((await self._session.scalars(page)).all())
+            # every batch is read in its own short transaction, a slow reader
+            # of the export must not keep one open past
+            # `idle_in_transaction_session_timeout`. Rows are detached first,
+            # so they stay loaded and the identity map does not grow
+            self._session.expunge_all()
+            await self._session.commit()
+            if not batch:
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            last = batch[-1]
+            after = (last.pub_date, last.id, last.tag)
+
     async def create(self, news_entry: NewsEntry):
-        self._session.add(news_entry)
+        await self.bulk_create(news_entry)
         return news_entry
 
     async def bulk_create(self, *news_entry: NewsEntry):
-        stmt = (
-            insert(NewsEntryModel)
-            .values([asdict(entry) for entry in news_entry])
+        started = time.perf_counter()
+        if news_entry:
+            await self._apply_first_pub_dates(news_entry)
+        if len(news_entry) >= self.copy_threshold:
+            await self._copy_create(news_entry)
+            method = "copy"
+        elif news_entry:
+            await self._insert_create(news_entry)
+            method = "insert"
+        else:
+            method = "noop"
+        await self._notify_changes(news_entry)
+        return BulkCreateStats(
+            rows=len(news_entry),
+            seconds=time.perf_counter() - started,
+            method=method,
+        )
+
+    async def _apply_first_pub_dates(self, news_entry: tuple[NewsEntry, ...]):
+        # rss dates have seconds and tag pages only minutes or a date, so one
+        # id comes with several pub_dates. `article_ids` keeps the first one,
+        # entries are updated in place and callers see the stored value
+        pub_dates: dict[str, datetime] = {}
+        for entry in news_entry:
+            pub_dates.setdefault(entry.id, entry.pub_date)
+        # sorted ids lock the unique index in one order in every transaction
+        ids = sorted(pub_dates)
+        await self._session.execute(
+            text(
+                "INSERT INTO article_ids (id, pub_date) "
+                "SELECT * FROM unnest("
+                "CAST(:ids AS varchar[]), CAST(:pub_dates AS timestamptz[])"
+                ") ON CONFLICT DO NOTHING"
+            ),
+            {"ids": ids, "pub_dates": [pub_dates[id_] for id_ in ids]},
+        )
+        stmt = select(ArticleIdModel.id, ArticleIdModel.pub_date).where(
+            ArticleIdModel.id == any_(bindparam("news_ids", ids, type_=ARRAY(String)))
+        )
+        pub_dates.update(dict((await self._session.execute(stmt)).tuples().all()))
+        for entry in news_entry:
+            entry.pub_date = pub_dates[entry.id]
+
+    async def _notify_changes(self, news_entry: tuple[NewsEntry, ...]):
+        # notifications are delivered to listeners only when the transaction
+        # commits, and are dropped on rollback
+        payloads = build_news_payloads(news_entry)
+        if not payloads:
+            return
+        await self._session.execute(
+            text(
+                "SELECT pg_notify(:channel, payload) "
+                "FROM unnest(CAST(:payloads AS text[])) AS payload"
+            ),
+            {"channel": NEWS_CHANNEL, "payloads": payloads},
+        )
+
+    async def _insert_create(self, news_entry: tuple[NewsEntry, ...]):
+        articles: dict[str, NewsEntry] = {}
+        for entry in news_entry:
+            articles.setdefault(entry.id, entry)
+        await self._session.execute(
+            insert(ArticleModel)
+            .values(
+                [
+                    {
+                        "id": entry.id,
+                        "pub_date": entry.pub_date,
+                        "title": entry.title,
+                        "preview_url": entry.preview_url,
+                        "parsed_date": entry.parsed_date,
+                    }
+                    for entry in articles.values()
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        await self._session.execute(
+            insert(ArticleTagModel)
+            .values(
+                [
+                    {
+                        "tag": entry.tag,
+                        "pub_date": articles[entry.id].pub_date,
+                        "article_id": entry.id,
+                    }
+                    for entry in news_entry
+                ]
+            )
             .on_conflict_do_nothing()
         )
-        await self._session.execute(stmt)
+
+    async def _copy_create(self, news_entry: tuple[NewsEntry, ...]):
+        # executed through the session first, so the copy below runs inside the
+        # transaction sqlalchemy has already begun on this connection
+        await self._session.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {self._staging_table} ("
+                "position integer, id varchar, tag varchar, title varchar, "
+                "preview_url varchar, pub_date timestamptz, parsed_date timestamptz"
+                ") ON COMMIT DELETE ROWS"
+            )
+        )
+        conn = await self._session.connection()
+        raw_conn = await conn.get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            self._staging_table,
+            records=(
+                (
+                    position,
+                    entry.id,
+                    entry.tag,
+                    entry.title,
+                    entry.preview_url,
+                    entry.pub_date,
+                    entry.parsed_date,
+                )
+                for position, entry in enumerate(news_entry)
+            ),
+            columns=self._staging_columns,
+        )
+        await self._session.execute(
+            text(
+                "INSERT INTO articles (id, pub_date, title, preview_url, parsed_date) "
+                "SELECT DISTINCT ON (id) "
+                "id, pub_date, title, preview_url, parsed_date "
+                f"FROM {self._staging_table} ORDER BY id, position "
+                "ON CONFLICT DO NOTHING"
+            )
+        )
+        await self._session.execute(
+            text(
+                "INSERT INTO article_tags (tag, pub_date, article_id) "
+                "SELECT DISTINCT staging.tag, first.pub_date, first.id "
+                f"FROM {self._staging_table} AS staging JOIN ("
+                "SELECT DISTINCT ON (id) id, pub_date "
+                f"FROM {self._staging_table} ORDER BY id, position"
+                ") AS first USING (id) "
+                "ON CONFLICT DO NOTHING"
+            )
+        )
+        await self._session.execute(text(f"TRUNCATE {self._staging_table}"))
 
     async def exists_by_id(self, news_id: str):
-        stmt = select(exists().where(NewsEntryModel.id == news_id))
-        return await self._session.scalar(stmt) or False
+        return news_id in await self.existing_ids([news_id])
 
-    async def get_latest_news_id(self):
+    async def existing_ids(self, news_ids: list[str]) -> set[str]:
+        seen = {news_id for news_id in news_ids if news_id in self._seen_ids}
+        unknown = [news_id for news_id in news_ids if news_id not in seen]
+        if not unknown:
+            return seen
         stmt = (
-            select(NewsEntryModel.id).order_by(NewsEntryModel.pub_date.desc()).limit(1)
+            select(ArticleModel.id)
+            .where(
+                ArticleModel.id
+                == any_(bindparam("news_ids", unknown, type_=ARRAY(String)))
+            )
+            .distinct()
         )
+        found = set(await self._session.scalars(stmt))
+        self._seen_ids.update(found)
+        return seen | found
+
+    async def get_latest_news_id(self):
+        stmt = select(ArticleModel.id).order_by(ArticleModel.pub_date.desc()).limit(1)
         return await self._session.scalar(stmt)
 
     async def get_latest_news_id_by_tag(self, tag: str):
         stmt = (
-            select(NewsEntryModel.id)
-            .where(NewsEntryModel.tag == tag)
-            .order_by(NewsEntryModel.pub_date.desc())
+            select(ArticleTagModel.article_id)
+            .where(ArticleTagModel.tag == tag)
+            .order_by(ArticleTagModel.pub_date.desc())
+            .limit(1)
         )
         return await self._session.scalar(stmt)
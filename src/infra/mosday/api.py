@@ -1,11 +1,70 @@
-from aiohttp import ClientSession
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+    hdrs,
+)
+
+from src.infra.db.dto import HttpValidator
+
+from .config import CrawlerConfig
+from .dto import HttpPoolStats
+from .limiter import AdaptiveRateLimiter
 
 
 class MosDayApi:
-    def __init__(self) -> None:
+    news_url = "/news/rss.xml"
+    _retryable_statuses = frozenset((429, 500, 502, 503, 504))
+    _throttle_statuses = frozenset((429, 503))
+
+    def __init__(self, config: CrawlerConfig) -> None:
+        connector = TCPConnector(
+            limit=config.http_limit,
+            limit_per_host=config.http_limit_per_host,
+            keepalive_timeout=config.http_keepalive_timeout,
+            ttl_dns_cache=config.http_dns_cache_ttl,
+        )
+        timeout = ClientTimeout(
+            total=config.http_total_timeout,
+            connect=config.http_connect_timeout,
+            sock_read=config.http_read_timeout,
+        )
+        self.stats = HttpPoolStats(
+            limit=config.http_limit,
+            limit_per_host=config.http_limit_per_host,
+        )
         self._api = ClientSession(
             base_url="https://mosday.ru/",
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[self._build_trace_config()],
+        )
+        self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        self._limiter = AdaptiveRateLimiter(
+            rate=config.rate_limit,
+            min_rate=config.rate_limit_min,
+            max_rate=config.rate_limit_max,
+            target_latency=config.rate_limit_target_latency,
         )
+        self._retry_attempts = config.retry_attempts
+        self._retry_base_delay = config.retry_base_delay
+        self._retry_max_delay = config.retry_max_delay
+        self._validators: dict[str, HttpValidator] = {}
 
     async def start(self):
         ...
@@ -13,23 +72,140 @@ class MosDayApi:
     async def stop(self):
         await self._api.close()
 
+    def load_validators(self, *validators: HttpValidator):
+        for validator in validators:
+            self._validators[validator.url] = validator
+
+    def get_validator(self, url: str):
+        return self._validators.get(url)
+
+    def forget_validator(self, url: str):
+        self._validators.pop(url, None)
+
     async def get_news_by_tag(self, tag: str):
-        response = await self._api.get(f"/news/tags.php?{tag}")
-        response.raise_for_status()
-        return await response.read()
+        return await self._get(f"/news/tags.php?{tag}")
 
     async def get_news(self):
-        response = await self._api.get("/news/rss.xml")
-        response.raise_for_status()
-        return await response.read()
+        return await self._get(self.news_url)
+
+    async def get_news_if_modified(self):
+        return await self._get_if_modified(self.news_url)
 
     async def get_tags(self):
-        response = await self._api.get("/news/tags.php")
-        response.raise_for_status()
-        return await response.read()
+        return await self._get("/news/tags.php")
 
     async def get_news_detail(self, news_id: str):
         print(f"{news_id=}")
-        response = await self._api.get(f"/news/item.php?{news_id}")
-        response.raise_for_status()
-        return await response.read()
+        return await self._get(f"/news/item.php?{news_id}")
+
+    async def _get(self, url: str):
+        _, body = await self._request(url)
+        return body
+
+    async def _get_if_modified(self, url: str) -> bytes | None:
+        validator = self._validators.get(url)
+        headers = validator.request_headers if validator else None
+        response, body = await self._request(url, headers)
+        if response.status == 304:
+            return None
+        etag = response.headers.get(hdrs.ETAG)
+        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        if etag or last_modified:
+            self._validators[url] = HttpValidator(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        else:
+            self._validators.pop(url, None)
+        return body
+
+    async def _request(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        attempt = 0
+        while True:
+            await self._limiter.acquire()
+            try:
+                async with self._semaphore:
+                    # the latency fed to the limiter must not include the wait
+                    # for the semaphore, or the cap would throttle the rate
+                    started = time.monotonic()
+                    async with self._api.get(url, headers=headers) as response:
+                        if response.status in self._throttle_statuses:
+                            self._limiter.throttle()
+                        response.raise_for_status()
+                        body = await response.read()
+                    latency = time.monotonic() - started
+            except (
+                ClientConnectionError,
+                ClientPayloadError,
+                ClientResponseError,
+                asyncio.TimeoutError,
+            ) as e:
+                if attempt >= self._retry_attempts or not self._is_retryable(e):
+                    raise
+                await asyncio.sleep(self._get_retry_delay(attempt, e))
+                attempt += 1
+            else:
+                self._limiter.observe(latency)
+                return response, body
+
+    def _is_retryable(self, error: Exception):
+        if isinstance(error, ClientResponseError):
+            return error.status in self._retryable_statuses
+        return True
+
+    def _get_retry_delay(self, attempt: int, error: Exception):
+        delay = random.uniform(
+            0, min(self._retry_max_delay, self._retry_base_delay * 2**attempt)
+        )
+        if isinstance(error, ClientResponseError) and error.headers:
+            retry_after = error.headers.get(hdrs.RETRY_AFTER)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(self._retry_max_delay, float(retry_after)))
+        return delay
+
+    def _build_trace_config(self):
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_finish)
+        trace_config.on_request_exception.append(self._on_request_finish)
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ):
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+
+    async def _on_request_finish(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceRequestEndParams | TraceRequestExceptionParams,
+    ):
+        self.stats.in_flight -= 1
+
+    async def _on_connection_create(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ):
+        self.stats.connections_created += 1
+
+    async def _on_connection_reuse(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ):
+        self.stats.connections_reused += 1
@@ -1,4 +1,15 @@
 from dataclasses import dataclass
+from enum import Enum
+
+
+class PrestartMode(Enum):
+    BLOCKING = "blocking"
+    BACKGROUND = "background"
+
+
+class ParserBackend(Enum):
+    BS4 = "bs4"
+    LXML = "lxml"
 
 
 @dataclass(slots=True)
@@ -7,7 +18,67 @@ class CrawlerConfig:
     delay_seconds: float = 0
 
     parse_days: int = 2
+    parser_backend: ParserBackend = ParserBackend.BS4
+    parser_workers: int = 0
+
+    prestart_mode: PrestartMode = PrestartMode.BACKGROUND
+    prestart_workers: int = 8
+    max_concurrent_requests: int = 8
+    detail_concurrency: int = 8
+    seen_ids_cache_size: int = 10000
+
+    http_limit: int = 100
+    http_limit_per_host: int = 8
+    http_keepalive_timeout: float = 30
+    http_dns_cache_ttl: int = 300
+    http_connect_timeout: float = 10
+    http_read_timeout: float = 30
+    http_total_timeout: float = 60
+
+    rate_limit: float = 10
+    rate_limit_min: float = 1
+    rate_limit_max: float = 50
+    rate_limit_target_latency: float = 1
+    retry_attempts: int = 5
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30
 
     def __post_init__(self):
         if not self.delay_seconds:
             self.delay_seconds = self.delay_minutes * 60
+        if self.prestart_workers < 1:
+            raise RuntimeError(
+                "Value of `prestart_workers` variable expected is positive, "
+                f"but received `{self.prestart_workers}`"
+            )
+        if self.parser_workers < 0:
+            raise RuntimeError(
+                "Value of `parser_workers` variable expected is not negative, "
+                f"but received `{self.parser_workers}`"
+            )
+        if self.max_concurrent_requests < 1:
+            raise RuntimeError(
+                "Value of `max_concurrent_requests` variable expected is positive, "
+                f"but received `{self.max_concurrent_requests}`"
+            )
+        if self.detail_concurrency < 1:
+            raise RuntimeError(
+                "Value of `detail_concurrency` variable expected is positive, "
+                f"but received `{self.detail_concurrency}`"
+            )
+        if self.seen_ids_cache_size < 0:
+            raise RuntimeError(
+                "Value of `seen_ids_cache_size` variable expected is non-negative, "
+                f"but received `{self.seen_ids_cache_size}`"
+            )
+        if not 0 < self.rate_limit_min <= self.rate_limit <= self.rate_limit_max:
+            raise RuntimeError(
+                "Values of `rate_limit_min`, `rate_limit` and `rate_limit_max` "
+                "variables expected are positive and ascending, but received "
+                f"`{self.rate_limit_min}`, `{self.rate_limit}`, "
+                f"`{self.rate_limit_max}`"
+            )
+
+    @property
+    def is_background_prestart(self):
+        return self.prestart_mode is PrestartMode.BACKGROUND
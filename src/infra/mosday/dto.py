@@ -9,3 +9,32 @@ class NewsEntryFromRss:
     preview_url: str
     pub_date: datetime.datetime
     parsed_date: datetime.datetime
+
+
+@dataclass(slots=True)
+class PrestartProgress:
+    total: int = 0
+    processed: int = 0
+    failed: int = 0
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+    error: str | None = None
+
+    @property
+    def is_done(self):
+        return self.finished_at is not None
+
+    def reset(self):
+        self.total = self.processed = self.failed = 0
+        self.started_at = self.finished_at = None
+        self.error = None
+
+
+@dataclass(slots=True)
+class HttpPoolStats:
+    limit: int
+    limit_per_host: int
+    in_flight: int = 0
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
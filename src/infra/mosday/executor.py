@@ -0,0 +1,124 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.domain.news.models import NewsEntry
+
+from .config import ParserBackend
+from .dto import NewsEntryFromRss
+from .lxml_parser import MosDayLxmlParser
+from .parser import MosDayParser
+
+T = TypeVar("T")
+
+_parser: MosDayParser | None = None
+
+
+def create_parser(backend: ParserBackend) -> MosDayParser:
+    if backend is ParserBackend.LXML:
+        return MosDayLxmlParser()
+    return MosDayParser()
+
+
+def _init_worker(backend: ParserBackend):
+    global _parser
+    _parser = create_parser(backend)
+
+
+def _run_in_worker(func: Callable[..., T], *args: Any) -> T:
+    if _parser is None:
+        raise RuntimeError("parser is not initialized in this process")
+    return func(_parser, *args)
+
+
+def _extract_latest_news_id(parser: MosDayParser, xml: bytes):
+    return parser.extract_latest_news_id(xml)
+
+
+def _parse_news_from_rss(
+    parser: MosDayParser,
+    xml: bytes,
+    latest_news_id: str | None,
+):
+    stream = parser.stream_news_from_rss(xml)
+    return stream.latest_news_id, list(stream.until(latest_news_id))
+
+
+def _extract_tags_from_detail(parser: MosDayParser, html: bytes):
+    return parser.extract_tags_from_detail(html)
+
+
+def _parse_news(
+    parser: MosDayParser,
+    html: bytes,
+    tag: str,
+    latest_news_id: str | None,
+):
+    return [
+        NewsEntryFromRss(
+            id=entry.id,
+            title=entry.title,
+            preview_url=entry.preview_url,
+            pub_date=entry.pub_date,
+            parsed_date=entry.parsed_date,
+        )
+        for entry in parser.parse_news(html, tag, latest_news_id)
+    ]
+
+
+class AsyncMosDayParser:
+    def __init__(self, backend: ParserBackend, workers: int = 0) -> None:
+        self._parser = create_parser(backend)
+        self._executor = None
+        if workers:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(backend,),
+            )
+
+    async def stop(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def extract_latest_news_id(self, xml: bytes) -> str | None:
+        return await self._run(_extract_latest_news_id, xml)
+
+    async def parse_news_from_rss(
+        self,
+        xml: bytes,
+        latest_news_id: str | None,
+    ) -> tuple[str | None, list[NewsEntryFromRss]]:
+        return await self._run(_parse_news_from_rss, xml, latest_news_id)
+
+    async def extract_tags_from_detail(self, html: bytes) -> list[str] | None:
+        return await self._run(_extract_tags_from_detail, html)
+
+    async def parse_news(
+        self,
+        html: bytes,
+        tag: str,
+        latest_news_id: str | None = None,
+    ):
+        if not self._executor:
+            return self._parser.parse_news(html, tag, latest_news_id)
+        entries = await self._run(_parse_news, html, tag, latest_news_id)
+        return [
+            NewsEntry(
+                id=entry.id,
+                tag=tag,
+                title=entry.title,
+                preview_url=entry.preview_url,
+                pub_date=entry.pub_date,
+                parsed_date=entry.parsed_date,
+            )
+            for entry in entries
+        ]
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if not self._executor:
+            return func(self._parser, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _run_in_worker, func, *args)
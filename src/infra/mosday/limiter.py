@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+
+class AdaptiveRateLimiter:
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        target_latency: float,
+    ) -> None:
+        self.rate = rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._target_latency = target_latency
+        self._tokens = 1.0
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def observe(self, latency: float):
+        if latency > self._target_latency:
+            self.rate = max(self._min_rate, self.rate * 0.9)
+        else:
+            self.rate = min(self._max_rate, self.rate + 0.5)
+
+    def throttle(self):
+        self.rate = max(self._min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0)
+
+    def _refill(self):
+        now = time.monotonic()
+        capacity = max(1.0, self.rate)
+        self._tokens = min(
+            capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
@@ -0,0 +1,150 @@
+from datetime import datetime
+from io import BytesIO
+from itertools import islice
+
+from lxml import etree
+
+from src.domain.news.models import NewsEntry
+from src.utils.dt import make_aware, now
+
+from .parser import MosDayParser
+
+
+class _DetailTagsTarget:
+    def __init__(self) -> None:
+        self.tags: list[str] | None = None
+        self.done = False
+        self._article_depth = 0
+        self._font_depth = 0
+
+    def start(self, tag: str, attrib: dict[str, str]):
+        if self.done:
+            return
+        if tag == "article":
+            self._article_depth += 1
+        elif not self._article_depth:
+            return
+        elif tag == "font":
+            if self._font_depth:
+                self._font_depth += 1
+            elif attrib.get("color") == "#666666":
+                self._font_depth = 1
+                self.tags = []
+        elif tag == "a" and self._font_depth:
+            href = attrib.get("href")
+            if href is not None and self.tags is not None:
+                self.tags.append(href)
+
+    def end(self, tag: str):
+        if self.done or not self._article_depth:
+            return
+        if tag == "article":
+            self._article_depth -= 1
+            if not self._article_depth:
+                self.done = True
+        elif tag == "font" and self._font_depth:
+            self._font_depth -= 1
+            if not self._font_depth:
+                self.done = True
+
+    def data(self, data: str):
+        ...
+
+    def close(self):
+        return self.tags
+
+
+class MosDayLxmlParser(MosDayParser):
+    _chunk_size = 16 * 1024
+
+    def extract_tags_from_detail(self, html: bytes):
+        if not html.strip():
+            return
+        target = _DetailTagsTarget()
+        parser = etree.HTMLParser(target=target)
+        for offset in range(0, len(html), self._chunk_size):
+            parser.feed(html[offset : offset + self._chunk_size])
+            if target.done:
+                break
+        tags = parser.close()
+        if tags is None:
+            return
+        return [self._extract_tag_from_href(href) for href in tags]
+
+    def parse_news(
+        self,
+        html: bytes,
+        tag: str,
+        latest_news_id: str | None = None,
+    ):
+        parsed_date = now()
+        pub_date_fmt = "%d.%m.%Y %H:%M"
+        news: list[NewsEntry] = []
+        for tr in self._iter_news_rows(html):
+            blocks = list(tr.iter("td"))
+            if len(blocks) != 2:
+                continue
+            image_block, content_block = blocks
+            a_tag = next(content_block.iter("a"), None)
+            if a_tag is None:
+                continue
+            href = a_tag.get("href")
+            if href is None:
+                continue
+            id_ = self._extract_id_from_path(href)
+            if not id_:
+                continue
+            if latest_news_id and id_ == latest_news_id:
+                break
+            image = next(image_block.iter("img"), None)
+            if image is not None:
+                preview_url = self._build_preview_url(image.attrib["src"])
+            else:
+                preview_url = self._fallback_preview_url
+            pub_date_string = "".join(islice(content_block.itertext(), 2))[:16]
+            if not self._is_valid_dt_string(pub_date_string):
+                if not self._is_valid_date_string(pub_date_string[:10]):
+                    continue
+                pub_date_string = f"{pub_date_string[:10]} 00:00"
+            pub_date = make_aware(datetime.strptime(pub_date_string, pub_date_fmt))
+            title = "".join(text.strip() for text in a_tag.itertext() if text.strip())
+            news.append(
+                NewsEntry(
+                    id=id_,
+                    tag=tag,
+                    title=title,
+                    preview_url=preview_url,
+                    pub_date=pub_date,
+                    parsed_date=parsed_date,
+                )
+            )
+        return news
+
+    def _iter_news_rows(self, html: bytes):
+        if not html.strip():
+            return
+        tables: list[bool] = []
+        table_depth = 0
+        row_depth = 0
+        for event, element in etree.iterparse(
+            BytesIO(html),
+            events=("start", "end"),
+            html=True,
+            recover=True,
+        ):
+            if event == "start":
+                if element.tag == "table":
+                    is_news_table = element.get("width") == "95%"
+                    tables.append(is_news_table)
+                    table_depth += is_news_table
+                elif element.tag == "tr" and table_depth:
+                    row_depth += 1
+                continue
+            if element.tag == "table" and tables:
+                table_depth -= tables.pop()
+            elif element.tag == "tr" and table_depth:
+                row_depth -= 1
+                if not row_depth:
+                    yield from element.iter("tr")
+            if not row_depth:
+                element.clear()
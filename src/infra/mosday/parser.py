@@ -1,8 +1,11 @@
 import re
 from datetime import datetime
-from itertools import islice
+from io import BytesIO
+from itertools import chain, islice
+from typing import Generator
 
 from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
 
 from src.domain.news.models import NewsEntry
 from src.utils.dt import make_aware, now
@@ -10,6 +13,28 @@ from src.utils.dt import make_aware, now
 from .dto import NewsEntryFromRss
 
 
+RssEntry = tuple[str, NewsEntryFromRss | None]
+
+
+class RssStream:
+    def __init__(self, entries: Generator[RssEntry, None, None]) -> None:
+        self._entries = entries
+        self._head = next(entries, None)
+        self.latest_news_id = self._head[0] if self._head else None
+
+    def until(self, news_id: str | None):
+        if self._head is None:
+            return
+        try:
+            for id_, entry in chain((self._head,), self._entries):
+                if id_ == news_id:
+                    return
+                if entry is not None:
+                    yield entry
+        finally:
+            self._entries.close()
+
+
 class MosDayParser:
     _id_expr = re.compile(r"\?(\d*)")
     _dt_string_expr = re.compile(r"\d{2}.\d{2}.\d{4} \d{2}:\d{2}")
@@ -17,43 +42,38 @@ class MosDayParser:
     _fallback_preview_url = "https://mosday.ru/404"
 
     def extract_latest_news_id(self, xml: bytes):
-        strainer = SoupStrainer("item")
-        soup = BeautifulSoup(xml, "xml", parse_only=strainer)
-        item = soup.find("item")
-        if not item:
-            return
-        link = item.find("link")
-        if not isinstance(link, Tag):
-            return
-        return self._extract_id_from_path(link.get_text())
+        return self.stream_news_from_rss(xml).latest_news_id
 
     def parse_news_from_rss(self, xml: bytes, latest_news_id: str | None):
-        strainer = SoupStrainer("item")
-        soup = BeautifulSoup(xml, "xml", parse_only=strainer)
-        items: list[Tag] = soup.find_all("item")
+        return self.stream_news_from_rss(xml).until(latest_news_id)
+
+    def stream_news_from_rss(self, xml: bytes):
+        return RssStream(self._iter_rss_entries(xml))
+
+    def _iter_rss_entries(self, xml: bytes) -> Generator[RssEntry, None, None]:
         parsed_date = now()
         pub_date_fmt = "%a, %d %b %Y %H:%M:%S %z"
-        for item in items:
-            link = item.find("link")
-            if not isinstance(link, Tag):
+        for item in self._iter_rss_items(xml):
+            link = self._find(item, "link")
+            if link is None:
                 continue
-            id_ = self._extract_id_from_path(link.get_text())
-            if id_ == latest_news_id:
-                return
-            title_tag = item.find("title")
-            if not isinstance(title_tag, Tag):
+            id_ = self._extract_id_from_path(self._get_text(link))
+            title_tag = self._find(item, "title")
+            if title_tag is None:
+                yield id_, None
                 continue
-            title = title_tag.get_text()
-            enclosure_tag = item.find("enclosure")
-            if isinstance(enclosure_tag, Tag):
-                preview_url = enclosure_tag["url"]
+            title = self._get_text(title_tag)
+            enclosure_tag = self._find(item, "enclosure")
+            if enclosure_tag is not None:
+                preview_url = enclosure_tag.attrib["url"]
             else:
                 preview_url = self._fallback_preview_url
-            pub_date_tag = item.find("pubDate")
-            if not isinstance(pub_date_tag, Tag):
+            pub_date_tag = self._find(item, "pubDate")
+            if pub_date_tag is None:
+                yield id_, None
                 continue
-            pub_date = datetime.strptime(pub_date_tag.get_text(), pub_date_fmt)
-            yield NewsEntryFromRss(
+            pub_date = datetime.strptime(self._get_text(pub_date_tag), pub_date_fmt)
+            yield id_, NewsEntryFromRss(
                 id=id_,
                 title=title,
                 preview_url=preview_url,
@@ -61,6 +81,21 @@ class MosDayParser:
                 parsed_date=parsed_date,
             )
 
+    def _iter_rss_items(self, xml: bytes):
+        if not xml.strip():
+            return
+        for _, item in etree.iterparse(
+            BytesIO(xml),
+            events=("end",),
+            tag="item",
+            recover=True,
+            resolve_entities=False,
+        ):
+            yield item
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+
     def extract_tags_from_detail(self, html: bytes):
         soup = BeautifulSoup(html, "lxml")
         article = soup.find("article")
@@ -156,3 +191,11 @@ class MosDayParser:
         return self._dt_string_expr.fullmatch(dt_string)
     def _is_valid_date_string(self, dt_string: str):
         return self._date_string_expr.fullmatch(dt_string)
+
+    def _find(self, element: etree._Element, name: str):
+        for child in element.iter():
+            if isinstance(child.tag, str) and etree.QName(child).localname == name:
+                return child
+
+    def _get_text(self, element: etree._Element):
+        return "".join(element.itertext())
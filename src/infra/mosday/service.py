@@ -1,24 +1,28 @@
 import asyncio
 from datetime import timedelta
 from logging import Logger
+from typing import Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.constants import TAGS_LIST
 from src.domain.news.models import NewsEntry
-from src.infra.db.repositories.news import NewsRepo
+from src.infra.db.dto import CrawlState
+from src.infra.db.repositories import CrawlStateRepo, HttpValidatorRepo, NewsRepo
 from src.utils.dt import now
+from src.utils.lru import LruSet
 
 from .api import MosDayApi
 from .config import CrawlerConfig
-from .parser import MosDayParser
+from .dto import NewsEntryFromRss, PrestartProgress
+from .executor import AsyncMosDayParser
 
 
 class MosDayService:
     def __init__(
         self,
         api: MosDayApi,
-        parser: MosDayParser,
+        parser: AsyncMosDayParser,
         session_maker: async_sessionmaker[AsyncSession],
         config: CrawlerConfig,
         logger: Logger,
@@ -29,122 +33,300 @@ class MosDayService:
         self._config = config
         self._logger = logger.getChild(type(self).__name__)
         self._task = None
+        self._seen_ids: LruSet[str] = LruSet(config.seen_ids_cache_size)
+        self._listeners: list[Callable[[list[NewsEntry]], None]] = []
+        self.progress = PrestartProgress()
 
     async def start(self):
         await self._api.start()
+        async with self._session_maker() as session:
+            self._api.load_validators(*await HttpValidatorRepo(session).get_all())
         self._task = asyncio.create_task(self._run())
 
+    async def prestart_and_start(self):
+        try:
+            await self.prestart()
+        except Exception as e:
+            self._logger.exception("Prestart failed")
+            self.progress.error = repr(e)
+        await self.start()
+
+    async def lead(self):
+        self.progress.reset()
+        try:
+            await self.prestart_and_start()
+            if self._task:
+                await self._task
+        finally:
+            if self._task:
+                self._task.cancel()
+                self._task = None
+
+    def add_listener(self, listener: Callable[[list[NewsEntry]], None]):
+        self._listeners.append(listener)
+
     async def stop(self):
         await self._api.stop()
+        await self._parser.stop()
         if self._task:
             self._task.cancel()
 
     async def prestart(self):
-        async with self._session_maker() as session:
-            news_repo = NewsRepo(session)
-            news_xml = await self._api.get_news()
-            latest_news_id = self._parser.extract_latest_news_id(news_xml)
-            latest_news_id_in_db = await news_repo.get_latest_news_id()
+        self.progress.started_at = now()
+        try:
+            async with self._session_maker() as session:
+                news_repo = NewsRepo(session)
+                news_xml = await self._api.get_news()
+                latest_news_id = await self._parser.extract_latest_news_id(news_xml)
+                latest_news_id_in_db = await news_repo.get_latest_news_id()
+                unfinished_tags = await CrawlStateRepo(session).get_unfinished_tags()
             if latest_news_id_in_db is None or (
                 latest_news_id is not None and latest_news_id_in_db < latest_news_id
             ):
-                total = len(TAGS_LIST)
-                for idx, tag in enumerate(TAGS_LIST, 1):
-                    self._logger.info(f"[{idx} / {total}] Preprocess tag `{tag}`")
-                    try:
-                        await self._execute_by_tag(tag, news_repo)
-                    except Exception:
-                        self._logger.exception(f"[{idx} / {total}][FAILED] Preprocess tag `{tag}`")
-                        await session.rollback()
-                    else:
-                        await session.commit()
-                        self._logger.info(f"[{idx} / {total}][SUCCESS] Preprocess tag `{tag}`")
+                await self._backfill(TAGS_LIST)
+            elif unfinished_tags:
+                await self._backfill(
+                    [tag for tag in TAGS_LIST if tag in unfinished_tags]
+                )
+        finally:
+            self.progress.finished_at = now()
+
+    async def _backfill(self, tags: list[str]):
+        total = len(tags)
+        self.progress.total = total
+        queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for item in enumerate(tags, 1):
+            queue.put_nowait(item)
+        workers = [
+            asyncio.create_task(self._backfill_worker(queue, total))
+            for _ in range(min(self._config.prestart_workers, total))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        self._logger.info(f"HTTP pool stats: {self._api.stats}")
+
+    async def _backfill_worker(
+        self,
+        queue: asyncio.Queue[tuple[int, str]],
+        total: int,
+    ):
+        async with self._session_maker() as session:
+            while not queue.empty():
+                idx, tag = queue.get_nowait()
+                self._logger.info(f"[{idx} / {total}] Preprocess tag `{tag}`")
+                try:
+                    await self._execute_by_tag(tag, session)
+                except Exception:
+                    self._logger.exception(
+                        f"[{idx} / {total}][FAILED] Preprocess tag `{tag}`"
+                    )
+                    await session.rollback()
+                    await self._register_tag_error(tag, session)
+                    self.progress.failed += 1
+                else:
+                    self._logger.info(
+                        f"[{idx} / {total}][SUCCESS] Preprocess tag `{tag}`"
+                    )
+                self.progress.processed += 1
+
+    async def _register_tag_error(self, tag: str, session: AsyncSession):
+        try:
+            await CrawlStateRepo(session).increment_error_count(tag)
+            await session.commit()
+        except Exception:
+            self._logger.exception(f"Failed to register error of tag `{tag}`")
+            await session.rollback()
 
     async def _run(self):
         while True:
-            session = self._session_maker()
             try:
-                news_repo = NewsRepo(session)
-                news_xml = await self._api.get_news()
-                latest_news_id = self._parser.extract_latest_news_id(news_xml)
-                latest_news_id_in_db = await news_repo.get_latest_news_id()
-                if latest_news_id_in_db is None or (
-                    latest_news_id is not None and latest_news_id_in_db < latest_news_id
-                ):
-                    for news_entry in self._parser.parse_news_from_rss(
-                        news_xml, latest_news_id_in_db
-                    ):
-                        if await news_repo.exists_by_id(news_entry.id):
-                            continue
-                        news_detail_html = await self._api.get_news_detail(
-                            news_entry.id
-                        )
-                        tags = self._parser.extract_tags_from_detail(news_detail_html)
-                        if not tags:
-                            continue
-                        await news_repo.bulk_create(
-                            *(
-                                NewsEntry(
-                                    id=news_entry.id,
-                                    tag=tag,
-                                    title=news_entry.title,
-                                    preview_url=news_entry.preview_url,
-                                    pub_date=news_entry.pub_date,
-                                    parsed_date=news_entry.parsed_date,
-                                )
-                                for tag in tags
-                            )
-                        )
-                        await session.commit()
-            finally:
-                await session.close()
+                async with self._session_maker() as session:
+                    await self._poll(session)
+            except Exception:
+                self._logger.exception("News poll failed, retrying after the delay")
+            self._logger.debug(f"HTTP pool stats: {self._api.stats}")
             next_run = now() + timedelta(seconds=self._config.delay_seconds)
-            self._logger.info(f"Sleeping {self._config.delay_seconds} seconds. Next run in {next_run}")
+            self._logger.info(
+                f"Sleeping {self._config.delay_seconds} seconds. Next run in {next_run}"
+            )
             await asyncio.sleep(self._config.delay_seconds)
 
-    async def _execute_by_tag(self, tag: str, news_repo: NewsRepo):
-        latest_news_id = await news_repo.get_latest_news_id_by_tag(tag)
-        if latest_news_id:
-            await self._execute_by_tag_and_id(tag, news_repo, latest_news_id)
-        else:
-            await self._execute_by_tag_without_id(tag, news_repo)
+    async def _poll(self, session: AsyncSession):
+        news_xml = await self._api.get_news_if_modified()
+        if news_xml is None:
+            self._logger.info("News feed is not modified since the last poll")
+            return
+        try:
+            news_repo = NewsRepo(session, self._seen_ids)
+            candidates = await self._find_new_news(news_repo, news_xml)
+            # details are fetched outside of a transaction, an idle one would be
+            # killed by `idle_in_transaction_session_timeout`
+            await session.commit()
+            stored, is_complete = await self._fetch_news(candidates)
+            if stored:
+                await self._bulk_create(news_repo, stored)
+            validator = self._api.get_validator(self._api.news_url)
+            if not is_complete:
+                # a 304 would hide the postponed news from the next poll
+                self._api.forget_validator(self._api.news_url)
+            elif validator:
+                await HttpValidatorRepo(session).save(validator)
+            await session.commit()
+            self._seen_ids.update(news_entry.id for news_entry in stored)
+            self._notify(stored)
+        except BaseException:
+            self._api.forget_validator(self._api.news_url)
+            raise
 
-    async def _execute_by_tag_and_id(
+    async def _find_new_news(
         self,
-        tag: str,
         news_repo: NewsRepo,
-        latest_news_id: str,
-    ):
-        i = 1
-        id_ = None
-        tag_ = tag
-        while id_ != latest_news_id:
-            if i > 1:
-                tag_ = f"{tag}_{i}"
-            news_html = await self._api.get_news_by_tag(tag_)
-            news_entries = self._parser.parse_news(news_html, tag, latest_news_id)
-            if not news_entries:
+        news_xml: bytes,
+    ) -> list[NewsEntryFromRss]:
+        latest_news_id_in_db = await news_repo.get_latest_news_id()
+        latest_news_id, rss_entries = await self._parser.parse_news_from_rss(
+            news_xml, latest_news_id_in_db
+        )
+        if not (
+            latest_news_id_in_db is None
+            or (latest_news_id is not None and latest_news_id_in_db < latest_news_id)
+        ):
+            return []
+        candidates = {news_entry.id: news_entry for news_entry in rss_entries}
+        for news_id in await news_repo.existing_ids(list(candidates)):
+            candidates.pop(news_id, None)
+        return list(candidates.values())
+
+    async def _fetch_news(
+        self,
+        candidates: list[NewsEntryFromRss],
+    ) -> tuple[list[NewsEntry], bool]:
+        if not candidates:
+            return [], True
+        semaphore = asyncio.Semaphore(self._config.detail_concurrency)
+        results = await asyncio.gather(
+            *(self._fetch_tags(news_entry.id, semaphore) for news_entry in candidates),
+            return_exceptions=True,
+        )
+        news_entries: list[NewsEntry] = []
+        is_complete = True
+        # the feed lists the newest news first and the next poll stops at the
+        # newest stored one, so news newer than a failed detail are dropped too
+        # and the failed one is fetched again by the next poll
+        for news_entry, tags in zip(candidates, results):
+            if isinstance(tags, BaseException):
+                self._logger.error(
+                    f"Failed to fetch news detail `{news_entry.id}`, "
+                    "newer news are postponed until the next poll",
+                    exc_info=tags,
+                )
+                news_entries.clear()
+                is_complete = False
+                continue
+            if not tags:
+                continue
+            news_entries.extend(
+                NewsEntry(
+                    id=news_entry.id,
+                    tag=tag,
+                    title=news_entry.title,
+                    preview_url=news_entry.preview_url,
+                    pub_date=news_entry.pub_date,
+                    parsed_date=news_entry.parsed_date,
+                )
+                for tag in tags
+            )
+        return news_entries, is_complete
+
+    async def _bulk_create(self, news_repo: NewsRepo, news_entries: list[NewsEntry]):
+        stats = await news_repo.bulk_create(*news_entries)
+        self._logger.debug(
+            f"Stored {stats.rows} news via {stats.method} "
+            f"in {stats.seconds:.3f}s ({stats.rows_per_second:.0f} rows/s)"
+        )
+
+    async def _fetch_tags(self, news_id: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            news_detail_html = await self._api.get_news_detail(news_id)
+        return await self._parser.extract_tags_from_detail(news_detail_html)
+
+    async def _execute_by_tag(self, tag: str, session: AsyncSession):
+        state = await CrawlStateRepo(session).get(tag) or CrawlState(tag=tag)
+        if state.is_in_progress:
+            self._logger.info(f"Resume tag `{tag}` from page {state.last_page + 1}")
+        else:
+            state.stop_news_id = await NewsRepo(session).get_latest_news_id_by_tag(tag)
+        # pages are fetched outside of a transaction, each one is saved and
+        # committed in its own
+        await session.commit()
+        if state.stop_news_id:
+            await self._execute_by_tag_and_id(state, session)
+        else:
+            await self._execute_by_tag_without_id(state, session)
+
+    async def _execute_by_tag_and_id(self, state: CrawlState, session: AsyncSession):
+        page = state.last_page + 1
+        while True:
+            news_entries = await self._fetch_tag_page(state.tag, page)
+            ids = [news_entry.id for news_entry in news_entries]
+            done = not news_entries or state.stop_news_id in ids
+            if state.stop_news_id in ids:
+                news_entries = news_entries[: ids.index(state.stop_news_id)]
+            await self._save_tag_page(state, page, news_entries, done, session)
+            if done:
                 return
-            id_ = news_entries[-1].id
-            await news_repo.bulk_create(*news_entries)
-            i += 1
+            page += 1
 
     async def _execute_by_tag_without_id(
         self,
-        tag: str,
-        news_repo: NewsRepo,
+        state: CrawlState,
+        session: AsyncSession,
     ):
-        i = 1
-        dt = now()
-        target_dt = dt - timedelta(self._config.parse_days)
-        tag_ = tag
-        while dt > target_dt:
-            if i > 1:
-                tag_ = f"{tag}_{i}"
-            news_html = await self._api.get_news_by_tag(tag_)
-            news_entries = self._parser.parse_news(news_html, tag)
-            if not news_entries:
+        page = state.last_page + 1
+        target_dt = now() - timedelta(self._config.parse_days)
+        while True:
+            news_entries = await self._fetch_tag_page(state.tag, page)
+            done = not news_entries or news_entries[-1].pub_date <= target_dt
+            await self._save_tag_page(state, page, news_entries, done, session)
+            if done:
                 return
-            dt = news_entries[-1].pub_date
-            await news_repo.bulk_create(*news_entries)
-            i += 1
+            page += 1
+
+    async def _fetch_tag_page(self, tag: str, page: int):
+        tag_ = tag if page == 1 else f"{tag}_{page}"
+        news_html = await self._api.get_news_by_tag(tag_)
+        return await self._parser.parse_news(news_html, tag)
+
+    async def _save_tag_page(
+        self,
+        state: CrawlState,
+        page: int,
+        news_entries: list[NewsEntry],
+        done: bool,
+        session: AsyncSession,
+    ):
+        if news_entries:
+            await self._bulk_create(NewsRepo(session), news_entries)
+            state.last_news_id = news_entries[-1].id
+        if done:
+            state.last_page = 0
+            state.stop_news_id = None
+            state.last_success_at = now()
+            state.error_count = 0
+        else:
+            state.last_page = page
+        await CrawlStateRepo(session).save(state)
+        await session.commit()
+        self._notify(news_entries)
+
+    def _notify(self, news_entries: list[NewsEntry]):
+        if not news_entries:
+            return
+        for listener in self._listeners:
+            try:
+                listener(news_entries)
+            except Exception:
+                self._logger.exception(f"Listener {listener!r} failed")
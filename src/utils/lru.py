@@ -0,0 +1,28 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class LruSet(Generic[T]):
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[T, None] = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item: T):
+        if item not in self._items:
+            return False
+        self._items.move_to_end(item)
+        return True
+
+    def update(self, items: Iterable[T]):
+        if not self.maxsize:
+            return
+        for item in items:
+            self._items[item] = None
+            self._items.move_to_end(item)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
@@ -6,6 +6,7 @@ import sys
 import threading
 from multiprocessing.context import SpawnProcess
 from pathlib import Path
+from socket import socket
 from types import FrameType
 from typing import Callable, Iterator
 
@@ -268,6 +269,7 @@ spawn = multiprocessing.get_context("spawn")
 
 def get_subprocess(
     target: Callable[..., None],
+    sockets: list[socket] | None = None,
 ) -> SpawnProcess:
     """
     Called in the parent process, to instantiate a new child process instance.
@@ -287,6 +289,7 @@ def get_subprocess(
 
     kwargs = {
         "target": target,
+        "sockets": sockets,
         "stdin_fileno": stdin_fileno,
     }
 
@@ -298,6 +301,7 @@ def get_subprocess(
 
 def subprocess_started(
     target: Callable[..., None],
+    sockets: list[socket] | None,
     stdin_fileno: int | None,
 ) -> None:
     """
@@ -315,4 +319,7 @@ def subprocess_started(
         sys.stdin = os.fdopen(stdin_fileno)
 
     # Now we can call into `Server.run(sockets=sockets)`
-    target()
+    if sockets is None:
+        target()
+    else:
+        target(sockets)
@@ -0,0 +1,143 @@
+import logging
+import os
+import signal
+import threading
+import time
+from multiprocessing.context import SpawnProcess
+from socket import socket
+from types import FrameType
+from typing import Callable
+
+from .reloader import get_subprocess
+
+
+class WorkerSupervisor:
+    HANDLED_SIGNALS = (
+        signal.SIGINT,
+        signal.SIGTERM,
+    )
+
+    def __init__(
+        self,
+        target: Callable[[list[socket]], None],
+        sockets: list[socket],
+        workers: int,
+        name: str | None = None,
+        check_interval: float = 0.5,
+        restart_delay: float = 1,
+        graceful_timeout: float = 30,
+        min_uptime: float = 5,
+        max_startup_failures: int = 3,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if not name:
+            name = self.__class__.__name__
+        self.name = name
+        self.target = target
+        self.sockets = sockets
+        self.workers = workers
+        self.check_interval = check_interval
+        self.restart_delay = restart_delay
+        self.graceful_timeout = graceful_timeout
+        self.min_uptime = min_uptime
+        self.max_startup_failures = max_startup_failures
+        self.should_exit = threading.Event()
+        self.pid = os.getpid()
+        if not logger:
+            self.logger = logging.getLogger(name)
+        else:
+            self.logger = logger.getChild(name)
+
+        self.processes: list[SpawnProcess] = []
+        self.started_at: list[float] = []
+        self.startup_failures = 0
+        self.failed = False
+
+    def start(self) -> None:
+        self._startup()
+        self._observe()
+        self._shutdown()
+        if self.failed:
+            raise RuntimeError(
+                f"Worker processes failed on start-up {self.startup_failures} "
+                "times in a row"
+            )
+
+    def stop(
+        self,
+        sig: int | None = None,
+        frame: FrameType | None = None,
+    ) -> None:
+        self.should_exit.set()
+
+    def _init_signal_handlers(self):
+        for sig in self.HANDLED_SIGNALS:
+            signal.signal(sig, self._signal_handler)
+
+    def _signal_handler(
+        self,
+        sig: int,
+        frame: FrameType | None,
+    ) -> None:
+        self.stop(sig=sig, frame=frame)
+
+    def _startup(self) -> None:
+        self.logger.info(
+            f"Started supervisor process [{self.pid}] with {self.workers} workers"
+        )
+        self._init_signal_handlers()
+        for _ in range(self.workers):
+            self.processes.append(self._spawn())
+            self.started_at.append(time.monotonic())
+
+    def _spawn(self) -> SpawnProcess:
+        process = get_subprocess(target=self.target, sockets=self.sockets)
+        process.start()
+        return process
+
+    def _observe(self) -> None:
+        while not self.should_exit.wait(self.check_interval):
+            for index, process in enumerate(self.processes):
+                if process.is_alive():
+                    continue
+                self.logger.warning(
+                    f"Worker process [{process.pid}] exited with code "
+                    f"{process.exitcode}. Restarting..."
+                )
+                # workers which die right after start are broken rather than
+                # crashed, respawning them would go on forever
+                if time.monotonic() - self.started_at[index] < self.min_uptime:
+                    self.startup_failures += 1
+                else:
+                    self.startup_failures = 0
+                if self.startup_failures >= self.max_startup_failures:
+                    self.logger.error(
+                        f"Worker processes failed on start-up "
+                        f"{self.startup_failures} times in a row. Stopping..."
+                    )
+                    self.failed = True
+                    return
+                if self.should_exit.wait(self.restart_delay):
+                    return
+                self.processes[index] = self._spawn()
+                self.started_at[index] = time.monotonic()
+
+    def _shutdown(self) -> None:
+        # uvicorn stops accepting connections on SIGTERM and waits for the
+        # requests in flight, workers are killed only past the timeout
+        for process in self.processes:
+            process.terminate()
+        deadline = time.monotonic() + self.graceful_timeout
+        for process in self.processes:
+            process.join(max(0, deadline - time.monotonic()))
+            if process.is_alive():
+                self.logger.warning(
+                    f"Worker process [{process.pid}] did not stop in "
+                    f"{self.graceful_timeout} seconds. Killing..."
+                )
+                process.kill()
+                process.join()
+        for sock in self.sockets:
+            sock.close()
+
+        self.logger.info(f"Stopping supervisor process [{self.pid}]")
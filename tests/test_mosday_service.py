@@ -0,0 +1,230 @@
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from src.domain.news.models import NewsEntry
+from src.infra.db.dto import BulkCreateStats, CrawlState, HttpValidator
+from src.infra.mosday import service
+from src.infra.mosday.config import CrawlerConfig
+from src.infra.mosday.dto import NewsEntryFromRss
+from src.utils.dt import now
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+
+
+def rss_entry(news_id: str, minutes_ago: int):
+    return NewsEntryFromRss(
+        id=news_id,
+        title=f"News {news_id}",
+        preview_url=f"https://mosday.ru/news/img/{news_id}.jpg",
+        pub_date=NOW - timedelta(minutes=minutes_ago),
+        parsed_date=NOW,
+    )
+
+
+class FakeApi:
+    news_url = "/news/rss.xml"
+
+    def __init__(self, session: "FakeSession") -> None:
+        self.session = session
+        self.failing_ids: set[str] = set()
+        self.detail_requests: list[str] = []
+        self.validators: dict[str, HttpValidator] = {}
+        self.tag_page_requests: list[str] = []
+
+    async def get_news_if_modified(self):
+        self.validators[self.news_url] = HttpValidator(self.news_url, etag='"v1"')
+        return b"<rss/>"
+
+    def get_validator(self, url: str):
+        return self.validators.get(url)
+
+    def forget_validator(self, url: str):
+        self.validators.pop(url, None)
+
+    async def get_news_detail(self, news_id: str):
+        assert not self.session.in_transaction, "detail fetched in a transaction"
+        self.detail_requests.append(news_id)
+        if news_id in self.failing_ids:
+            raise TimeoutError(news_id)
+        return news_id.encode()
+
+    async def get_news_by_tag(self, tag: str):
+        assert not self.session.in_transaction, "tag page fetched in a transaction"
+        self.tag_page_requests.append(tag)
+        return tag.encode()
+
+
+class FakeParser:
+    def __init__(self, feed: list[NewsEntryFromRss]) -> None:
+        self.feed = feed
+        self.tag_pages: dict[str, list[NewsEntry]] = {}
+
+    async def parse_news_from_rss(self, xml: bytes, latest_news_id: str | None):
+        entries: list[NewsEntryFromRss] = []
+        for entry in self.feed:
+            if entry.id == latest_news_id:
+                break
+            entries.append(entry)
+        return self.feed[0].id, entries
+
+    async def extract_tags_from_detail(self, html: bytes):
+        return ["metro"]
+
+    async def parse_news(self, html: bytes, tag: str):
+        return self.tag_pages.get(html.decode(), [])
+
+
+class FakeNewsRepo:
+    def __init__(self, session: "FakeSession") -> None:
+        self.session = session
+        self.rows: list[NewsEntry] = []
+
+    async def get_latest_news_id(self):
+        self.session.in_transaction = True
+        if not self.rows:
+            return None
+        return max(self.rows, key=lambda news_entry: news_entry.pub_date).id
+
+    async def get_latest_news_id_by_tag(self, tag: str):
+        self.session.in_transaction = True
+        return None
+
+    async def existing_ids(self, news_ids: list[str]):
+        self.session.in_transaction = True
+        return {news_entry.id for news_entry in self.rows} & set(news_ids)
+
+    async def bulk_create(self, *news_entry: NewsEntry):
+        self.session.in_transaction = True
+        self.rows.extend(news_entry)
+        return BulkCreateStats(rows=len(news_entry), seconds=0, method="insert")
+
+
+class FakeHttpValidatorRepo:
+    def __init__(self) -> None:
+        self.saved: list[HttpValidator] = []
+
+    async def save(self, validator: HttpValidator):
+        self.saved.append(validator)
+
+
+class FakeCrawlStateRepo:
+    def __init__(self, session: "FakeSession") -> None:
+        self.session = session
+        self.saved: list[tuple[int, str | None]] = []
+
+    async def get(self, tag: str):
+        self.session.in_transaction = True
+        return None
+
+    async def save(self, state: CrawlState):
+        self.session.in_transaction = True
+        self.saved.append((state.last_page, state.last_news_id))
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.commits = 0
+
+    async def commit(self):
+        self.in_transaction = False
+        self.commits += 1
+
+    async def rollback(self):
+        self.in_transaction = False
+
+
+class ServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.session = FakeSession()
+        self.api = FakeApi(self.session)
+        self.parser = FakeParser(
+            [rss_entry(str(news_id), 105 - news_id) for news_id in range(105, 100, -1)]
+        )
+        self.repo = FakeNewsRepo(self.session)
+        self.service = service.MosDayService(
+            self.api,
+            self.parser,
+            None,
+            CrawlerConfig(),
+            logging.getLogger("test"),
+        )
+        patcher = mock.patch.object(
+            service, "NewsRepo", lambda session, seen_ids=None: self.repo
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.validator_repo = FakeHttpValidatorRepo()
+        patcher = mock.patch.object(
+            service, "HttpValidatorRepo", lambda session: self.validator_repo
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stored_ids(self):
+        return sorted(news_entry.id for news_entry in self.repo.rows)
+
+
+class PollTest(ServiceTestCase):
+    async def test_failed_detail_is_stored_by_next_poll(self):
+        self.api.failing_ids = {"103"}
+        await self.service._poll(self.session)
+        self.assertEqual(self.stored_ids(), ["101", "102"])
+        self.assertEqual(self.validator_repo.saved, [])
+        self.assertIsNone(self.api.get_validator(self.api.news_url))
+
+        self.api.failing_ids = set()
+        self.api.detail_requests.clear()
+        await self.service._poll(self.session)
+        self.assertEqual(sorted(self.api.detail_requests), ["103", "104", "105"])
+        self.assertEqual(self.stored_ids(), ["101", "102", "103", "104", "105"])
+
+    async def test_all_details_are_stored(self):
+        await self.service._poll(self.session)
+        self.assertEqual(self.stored_ids(), ["101", "102", "103", "104", "105"])
+        self.assertEqual(
+            self.validator_repo.saved, [HttpValidator(self.api.news_url, etag='"v1"')]
+        )
+
+
+class BackfillTest(ServiceTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.state_repo = FakeCrawlStateRepo(self.session)
+        patcher = mock.patch.object(
+            service, "CrawlStateRepo", lambda session: self.state_repo
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tag_page(self, page: int):
+        return [
+            NewsEntry(
+                id=f"{page}{index}",
+                tag="metro",
+                title="News",
+                preview_url="https://mosday.ru/404",
+                pub_date=now() - timedelta(hours=page),
+                parsed_date=NOW,
+            )
+            for index in range(3)
+        ]
+
+    async def test_each_page_is_committed(self):
+        self.parser.tag_pages = {
+            "metro": self.tag_page(0),
+            "metro_2": self.tag_page(1),
+            "metro_3": self.tag_page(2),
+        }
+        await self.service._execute_by_tag("metro", self.session)
+        self.assertEqual(
+            self.api.tag_page_requests, ["metro", "metro_2", "metro_3", "metro_4"]
+        )
+        self.assertEqual(len(self.repo.rows), 9)
+        self.assertEqual(
+            self.state_repo.saved, [(1, "02"), (2, "12"), (3, "22"), (0, "22")]
+        )
+        # the state read and every page
+        self.assertEqual(self.session.commits, 5)
@@ -0,0 +1,89 @@
+import logging
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from src.domain.news import NewsEntry
+from src.http import news_index
+from src.http.config import NewsIndexConfig
+from src.http.news_index import NewsIndex
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+TAGS = ("metro", "moscow")
+
+
+def build_entries(count: int):
+    rnd = random.Random(1)
+    return [
+        NewsEntry(
+            id=str(1000 + index),
+            tag=rnd.choice(TAGS),
+            title=f"News {index}",
+            preview_url=f"https://mosday.ru/news/img/{index}.jpg",
+            # minute precision gives many news with the same pub_date
+            pub_date=NOW - timedelta(minutes=rnd.randint(0, 60 * 24 * 10)),
+            parsed_date=NOW,
+        )
+        for index in range(count)
+    ]
+
+
+class NewsIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(news_index, "utcnow", lambda: NOW)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.entries = build_entries(3000)
+        self.index = NewsIndex(
+            None, NewsIndexConfig(window_days=7), logging.getLogger("test")
+        )
+
+    def brute_force(self, tag: str, day: int, limit: int, after):
+        since = NOW - timedelta(days=day)
+        news = sorted(
+            {
+                (entry.pub_date, entry.id): entry
+                for entry in self.entries
+                if entry.tag == tag
+                and entry.pub_date > since
+                and (after is None or (entry.pub_date, entry.id) < after)
+            }.values(),
+            key=lambda entry: (entry.pub_date, entry.id),
+            reverse=True,
+        )
+        return [entry.id for entry in news[:limit]], len(news) > limit
+
+    def test_not_ready(self):
+        self.index.add(self.entries)
+        self.assertIsNone(self.index.get_page_by_tag("metro", 1, 10))
+
+    def test_paging_matches_brute_force(self):
+        # entries added before and after warming, some of them twice
+        self.index.add(self.entries[:1500])
+        self.index._since = NOW - timedelta(days=7)
+        self.index.add(self.entries[1500:])
+        self.index.add(self.entries[:10])
+        for tag in TAGS:
+            for day in (1, 3, 7):
+                after = None
+                pages = 0
+                while True:
+                    page = self.index.get_page_by_tag(tag, day, 37, after)
+                    self.assertIsNotNone(page)
+                    news, has_more = page
+                    self.assertEqual(
+                        ([entry.id for entry in news], has_more),
+                        self.brute_force(tag, day, 37, after),
+                    )
+                    pages += 1
+                    if not has_more:
+                        break
+                    after = (news[-1].pub_date, news[-1].id)
+                self.assertGreater(pages, 1)
+
+    def test_outside_of_window(self):
+        self.index._since = NOW - timedelta(days=7)
+        self.index.add(self.entries)
+        self.assertIsNone(self.index.get_page_by_tag("metro", 8, 10))
+        self.assertEqual(self.index.get_page_by_tag("transport", 1, 10), ([], False))
@@ -0,0 +1,73 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from src.domain.news.models import NewsEntry
+from src.http.setup.orm_mapping import setup_orm_mapping
+from src.infra.config_loader import load_config
+from src.infra.db.config import DbConfig
+from src.infra.db.factories import create_engine, create_session_maker
+from src.infra.db.models import ArticleModel, ArticleTagModel
+from src.infra.db.repositories import NewsRepo
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+TAGS = ("metro", "moscow")
+
+
+def setUpModule():
+    setup_orm_mapping()
+
+
+def build_entries(count: int, seconds: int):
+    return [
+        NewsEntry(
+            id=f"copy-test-{index}",
+            tag=tag,
+            title=f"News {index}",
+            preview_url=f"https://mosday.ru/news/img/{index}.jpg",
+            pub_date=NOW - timedelta(minutes=index, seconds=seconds),
+            parsed_date=NOW,
+        )
+        for index in range(count)
+        for tag in TAGS
+    ]
+
+
+@unittest.skipUnless(
+    os.environ.get("DB__HOST"),
+    "needs a Postgres upgraded to the alembic head, configured by DB__* variables",
+)
+class CopyCreateTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        config = load_config(DbConfig, scope="DB")
+        self.engine = create_engine(url=config.url, echo=False)
+        self.session = create_session_maker(self.engine)()
+
+    async def asyncTearDown(self) -> None:
+        # everything is written in one transaction which is never committed
+        await self.session.rollback()
+        await self.session.close()
+        await self.engine.dispose()
+
+    async def count(self, column):
+        stmt = select(func.count()).where(column.like("copy-test-%"))
+        return await self.session.scalar(stmt)
+
+    async def test_copy_create(self):
+        news_repo = NewsRepo(self.session)
+        count = NewsRepo.copy_threshold
+
+        stats = await news_repo.bulk_create(*build_entries(count, seconds=30))
+        self.assertEqual(stats.method, "copy")
+        self.assertEqual(stats.rows, count * len(TAGS))
+        self.assertEqual(await self.count(ArticleModel.id), count)
+        self.assertEqual(await self.count(ArticleTagModel.article_id), count * 2)
+
+        # the same news read from tag pages have minute precision dates
+        entries = build_entries(count, seconds=0)
+        await news_repo.bulk_create(*entries)
+        self.assertEqual(await self.count(ArticleModel.id), count)
+        self.assertEqual(await self.count(ArticleTagModel.article_id), count * 2)
+        self.assertEqual(entries[0].pub_date, NOW - timedelta(seconds=30))
@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime, timezone
+
+import orjson
+
+from src.domain.news import NewsEntry
+from src.infra.db.notifications import MAX_PAYLOAD_SIZE, build_news_payloads
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+TAGS = ("metro", "moscow", "transport")
+
+
+def build_entries(count: int, id_prefix: str = ""):
+    return [
+        NewsEntry(
+            id=f"{id_prefix}{index}",
+            tag=TAGS[index % len(TAGS)],
+            title=f"News {index}",
+            preview_url=f"https://mosday.ru/news/img/{index}.jpg",
+            pub_date=NOW,
+            parsed_date=NOW,
+        )
+        for index in range(count)
+    ]
+
+
+class BuildNewsPayloadsTest(unittest.TestCase):
+    def assert_packed(self, news_entries: list[NewsEntry]):
+        payloads = build_news_payloads(news_entries)
+        covered: set[tuple[str, str]] = set()
+        for payload in payloads:
+            size = len(payload.encode())
+            self.assertLessEqual(size, MAX_PAYLOAD_SIZE)
+            self.assertLess(size, 8000)
+            data = orjson.loads(payload)
+            covered.update(
+                (tag, news_id) for tag in data["tags"] for news_id in data["ids"]
+            )
+        self.assertLessEqual(
+            {(news_entry.tag, news_entry.id) for news_entry in news_entries}, covered
+        )
+        return payloads
+
+    def test_empty(self):
+        self.assertEqual(build_news_payloads([]), [])
+
+    def test_single_payload(self):
+        payloads = self.assert_packed(build_entries(10))
+        self.assertEqual(len(payloads), 1)
+
+    def test_large_batch_is_split(self):
+        payloads = self.assert_packed(build_entries(5000))
+        self.assertGreater(len(payloads), 1)
+
+    def test_multibyte_ids(self):
+        # the limit is in bytes, not characters
+        payloads = self.assert_packed(build_entries(3000, id_prefix="новость-"))
+        self.assertGreater(len(payloads), 1)
+
+    def test_news_with_several_tags(self):
+        news_entries = [
+            NewsEntry(
+                id=news_entry.id,
+                tag=tag,
+                title=news_entry.title,
+                preview_url=news_entry.preview_url,
+                pub_date=news_entry.pub_date,
+                parsed_date=news_entry.parsed_date,
+            )
+            for news_entry in build_entries(2000)
+            for tag in TAGS
+        ]
+        self.assert_packed(news_entries)
@@ -0,0 +1,127 @@
+import unittest
+
+from src.infra.mosday.lxml_parser import MosDayLxmlParser
+from src.infra.mosday.parser import MosDayParser
+
+RSS_TEXT = """<?xml version="1.0" encoding="windows-1251"?>
+<rss version="2.0"><channel><title>Новости</title>
+<item>
+<title>Метро &amp; МЦК</title>
+<link>https://mosday.ru/news/item.php?4105</link>
+<pubDate>Sun, 18 Oct 2026 10:00:00 +0300</pubDate>
+<enclosure url="https://mosday.ru/news/img/4105.jpg" type="image/jpeg"/>
+</item>
+<item>
+<link>https://mosday.ru/news/item.php?4104</link>
+<pubDate>Sun, 18 Oct 2026 09:30:00 +0300</pubDate>
+</item>
+<item>
+<title>Без картинки</title>
+<link>https://mosday.ru/news/item.php?4103</link>
+<pubDate>Sun, 18 Oct 2026 09:00:00 +0300</pubDate>
+</item>
+<item>
+<title>Старая</title>
+<link>https://mosday.ru/news/item.php?4102</link>
+<pubDate>Sat, 17 Oct 2026 23:59:59 +0300</pubDate>
+</item>
+</channel></rss>
+"""
+
+TAG_PAGE_TEXT = """<html><head><meta charset="windows-1251"></head>
+<body><table><tr><td>
+<table width="95%">
+<tr>
+<td><a href="item.php?4105"><img src="img/4105.jpg"></a></td>
+<td><b>18.10.2026 10:00</b> <a href="item.php?4105">Метро <i>и</i> МЦК</a>
+<br>text</td>
+</tr>
+<tr><td></td><td>17.10.2026 <a href="item.php?4101">Только дата</a></td></tr>
+<tr>
+<td><img src="img/4100.jpg"></td>
+<td><b>16.10.2026 08:15</b><a href="item.php?4100"> С вложенной </a>
+<table><tr><td>a</td><td><a href="item.php?9">nested</a></td></tr></table></td>
+</tr>
+<tr><td></td><td>без даты <a href="item.php?4099">Пропуск</a></td></tr>
+</table>
+</td></tr></table>
+<table width="95%">
+<tr><td>x</td>
+<td>15.10.2026 09:00<a href="item.php?4098">Вторая таблица</a></td></tr>
+</table>
+</body></html>
+"""
+
+DETAIL_TEXT = """<html><head><meta charset="windows-1251"></head>
+<body><article><p>Текст</p>
+<font color="#666666">Теги: <a href="tags.php?metro">Метро</a>,
+<font><a href="tags.php?transport">Транспорт</a></font></font>
+<a href="tags.php?other">Другое</a>
+</article></body></html>
+"""
+
+RSS = RSS_TEXT.encode("cp1251")
+TAG_PAGE = TAG_PAGE_TEXT.encode("cp1251")
+DETAIL = DETAIL_TEXT.encode("cp1251")
+
+
+def rss_fields(entries):
+    return [
+        (entry.id, entry.title, entry.preview_url, entry.pub_date) for entry in entries
+    ]
+
+
+def page_fields(entries):
+    return [
+        (entry.id, entry.tag, entry.title, entry.preview_url, entry.pub_date)
+        for entry in entries
+    ]
+
+
+class ParserParityTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parsers = [MosDayParser(), MosDayLxmlParser()]
+
+    def assert_same(self, func):
+        bs4_result, lxml_result = (func(parser) for parser in self.parsers)
+        self.assertEqual(bs4_result, lxml_result)
+        return bs4_result
+
+    def test_rss(self):
+        latest_news_id = self.assert_same(
+            lambda parser: parser.extract_latest_news_id(RSS)
+        )
+        self.assertEqual(latest_news_id, "4105")
+        entries = self.assert_same(
+            lambda parser: rss_fields(parser.parse_news_from_rss(RSS, None))
+        )
+        self.assertEqual([entry[0] for entry in entries], ["4105", "4103", "4102"])
+        entries = self.assert_same(
+            lambda parser: rss_fields(parser.parse_news_from_rss(RSS, "4103"))
+        )
+        self.assertEqual([entry[0] for entry in entries], ["4105"])
+
+    def test_tag_page(self):
+        entries = self.assert_same(
+            lambda parser: page_fields(parser.parse_news(TAG_PAGE, "metro"))
+        )
+        # the row with a nested table has four cells and is skipped by both
+        self.assertEqual([entry[0] for entry in entries], ["4105", "4101", "4098"])
+        entries = self.assert_same(
+            lambda parser: page_fields(parser.parse_news(TAG_PAGE, "metro", "4101"))
+        )
+        self.assertEqual([entry[0] for entry in entries], ["4105"])
+
+    def test_detail(self):
+        tags = self.assert_same(lambda parser: parser.extract_tags_from_detail(DETAIL))
+        self.assertEqual(tags, ["metro", "transport"])
+        self.assert_same(
+            lambda parser: parser.extract_tags_from_detail(
+                b"<html><article>text</article></html>"
+            )
+        )
+
+    def test_empty_input(self):
+        self.assert_same(lambda parser: parser.extract_latest_news_id(b""))
+        self.assert_same(lambda parser: list(parser.parse_news_from_rss(b"", None)))
+        self.assert_same(lambda parser: parser.parse_news(b"", "metro"))